@@ -13,29 +13,109 @@ Features:
 """
 
 import asyncio
+import concurrent.futures
+import heapq
 import json
 import logging
 import os
-import uuid
-import pickle
+import random
+import re
+import sqlite3
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
+from zoneinfo import ZoneInfo
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 import traceback
 
-import requests
-import schedule
+import aiohttp
+import orjson
 import time
 from dotenv import load_dotenv
-from google.oauth2.credentials import Credentials
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+
+# requests and the Google client libraries are imported where they are first used,
+# so modes that never touch them (status, test, join) start faster
+if TYPE_CHECKING:
+    import requests
+    from google.oauth2.credentials import Credentials
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
 # Load environment variables from .env file
 load_dotenv()
 
+# How long an existing-meeting lookup against Google Calendar stays valid
+MEETING_CHECK_TTL = 60  # seconds
+MEETING_CHECK_CACHE_SIZE = 256
+
+# Maximum number of calls Google Calendar accepts in one batch request
+CALENDAR_BATCH_SIZE = 50
+
+# Upper bound for the adaptive transcript poll interval
+MAX_TRANSCRIPT_POLL_INTERVAL = 300  # seconds
+
+# Matches standup event titles anywhere in the summary, case-insensitively
+STANDUP_TITLE = re.compile(r"standup", re.IGNORECASE)
+
+# Full-jitter backoff bounds for webhook retries
+WEBHOOK_BACKOFF_BASE = 0.5  # seconds
+WEBHOOK_BACKOFF_CAP = 30  # seconds
+
+# Scheduler timing: join window, cleanup age and idle cap
+JOIN_WINDOW = 600  # seconds after start a bot may still join
+JOIN_RECHECK_INTERVAL = timedelta(seconds=5)  # recheck for sessions still waiting to join
+SESSION_CLEANUP_AGE = timedelta(hours=2)
+SCHEDULER_MAX_SLEEP = 300  # seconds
+
+# Admission monitoring: overall limit and fallback status checks when no push arrives
+ADMISSION_MONITOR_TIMEOUT = 600  # seconds
+ADMISSION_LIVENESS_INTERVAL = 60  # seconds, while the status receiver is running
+ADMISSION_POLL_INTERVAL = 5  # seconds, without a status receiver
+
+# Join confirmation: how long to wait for an active bot and how often to check without a push
+JOIN_CONFIRM_TIMEOUT = 10  # seconds
+JOIN_VERIFY_INTERVAL = 1  # seconds, without a status receiver
+
+# Path of the in-process receiver for Vexa bot status webhooks
+STATUS_WEBHOOK_PATH = "/bot-status"
+
+# Vexa bot statuses that mean the bot is in the meeting
+BOT_ACTIVE_STATUSES = ("active", "in_meeting", "connected")
+
+# How long a bot verification result is reused by other callers
+VERIFY_CACHE_TTL = 1  # seconds
+
+# Per-bot status endpoints, most specific first; {id} is the native meeting id
+BOT_STATUS_ENDPOINTS = ("/bots/google_meet/{id}", "/bots/{id}")
+
+# Full bot list, a last resort that is never remembered as the endpoint to use
+BOT_LIST_ENDPOINT = "/bots"
+
+# Session statuses restored from the database on startup
+LIVE_SESSION_STATUSES = ('created', 'bot_joining', 'in_progress')
+
+# Pickle file sessions were kept in before the session database; imported once, then renamed
+LEGACY_SESSIONS_FILE = "active_sessions.pkl"
+
+# Required configuration keys as pre-split paths
+REQUIRED_CONFIG = (
+    (("vexa", "api_key"), "Vexa API key"),
+    (("webhook", "url"), "Webhook URL"),
+)
+
+
+def _config_lookup(config: Dict, path: tuple) -> Any:
+    """Walk a nested config dict along a key path, returning None if any key is missing"""
+    value = config
+    for key in path:
+        value = value.get(key) if isinstance(value, dict) else None
+        if value is None:
+            break
+    return value
+
 
 class MeetingStatus(Enum):
     CREATED = "created"
@@ -57,6 +137,37 @@ class MeetingSession:
     transcript: Optional[str] = None
     error_message: Optional[str] = None
     retry_count: int = 0
+    last_transcript_len: int = 0
+    consecutive_unchanged: int = 0
+    transcript_etag: Optional[str] = None
+    next_poll_at: float = 0.0
+    bot_status: Optional[str] = None
+    admission_event: Optional[asyncio.Event] = field(default=None, repr=False, compare=False)
+    joined_event: Optional[asyncio.Event] = field(default=None, repr=False, compare=False)
+    _persist_dict: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+    _vexa_urls: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name not in ('_persist_dict', '_vexa_urls'):
+            # Any change invalidates the cached serialized form
+            object.__setattr__(self, '_persist_dict', None)
+        if name == 'google_meet_id':
+            object.__setattr__(self, '_vexa_urls', None)
+    
+    def to_persist_dict(self) -> Dict:
+        """Return the serializable row form of the session, cached until it changes"""
+        if self._persist_dict is None:
+            self._persist_dict = {
+                'meeting_id': self.meeting_id,
+                'google_meet_url': self.google_meet_url,
+                'google_meet_id': self.google_meet_id,
+                'start_time': self.start_time.isoformat(),
+                'end_time': self.end_time.isoformat() if self.end_time else None,
+                'status': self.status.value,
+                'bot_session_id': self.bot_session_id
+            }
+        return self._persist_dict
 
 
 class AthenaMeetBot:
@@ -66,12 +177,34 @@ class AthenaMeetBot:
         """Initialize Athena bot with configuration"""
         self.config = self._load_config(config_path)
         self.logger = self._setup_logging()
-        self.google_service = None
+        self._cache_hot_config()
+        self._google_service = None
+        self._google_initialized = False
         self._active_sessions: Dict[str, MeetingSession] = {}
-        self.sessions_file = "active_sessions.pkl"
-        
-        # Initialize Google Calendar service
-        self._init_google_calendar()
+        self.sessions_file = "sessions.db"
+        self._sessions_db = self._open_sessions_db()
+        self._import_legacy_sessions()
+        self._dirty: set = set()
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._vexa_session: Optional["requests.Session"] = None
+        self._meeting_check_cache: Dict[tuple, tuple] = {}
+        self._sessions_by_minute: Dict[datetime, str] = {}
+        self._pending_join_heap: List[tuple] = []
+        self._cleanup_heap: List[tuple] = []
+        self._monitored_sessions: Dict[str, MeetingSession] = {}
+        self._transcript_task: Optional[asyncio.Task] = None
+        self._daily_timer_task: Optional[asyncio.Task] = None
+        self._tick_now: datetime = datetime.now()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._join_heap: List[tuple] = []
+        self._join_task: Optional[asyncio.Task] = None
+        self._vexa_bot_endpoint: Optional[str] = None
+        self._verify_inflight: Dict[str, asyncio.Future] = {}
+        self._verify_cache: Dict[str, tuple] = {}
+        self._status_runner: Optional["aiohttp.web.AppRunner"] = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="athena-sched"
+        )
         
         # Validate configuration
         self._validate_config()
@@ -79,6 +212,99 @@ class AthenaMeetBot:
         # Load existing sessions
         self._load_sessions()
     
+    def _cache_hot_config(self):
+        """Bind frequently used config values and headers to the instance"""
+        self._vexa_url = self.config["vexa"]["base_url"]
+        self._vexa_key = self.config["vexa"]["api_key"]
+        self._vexa_timeout = self.config["vexa"]["timeout"]
+        self._bots_url = f"{self._vexa_url}/bots"
+        self._transcripts_url = f"{self._vexa_url}/v1/transcripts/google_meet"
+        self._vexa_headers = {'X-API-Key': self._vexa_key}
+        self._vexa_json_headers = {'X-API-Key': self._vexa_key, 'Content-Type': 'application/json'}
+        self._webhook_url = self.config["webhook"]["url"]
+        # Vexa posts bot status changes to the status receiver when one is configured
+        self._status_port = self.config["bot"]["status_port"]
+        self._bot_webhook_url = self.config["bot"]["status_url"] or self._webhook_url
+        self._webhook_headers = {'Content-Type': 'application/json'}
+        if self.config["webhook"].get("secret"):
+            self._webhook_headers['X-Webhook-Secret'] = self.config["webhook"]["secret"]
+        self._webhook_retry = self.config["webhook"]["retry_attempts"]
+        self._webhook_timeout = aiohttp.ClientTimeout(total=self.config["webhook"]["timeout"])
+        self._poll_interval = self.config["bot"]["transcript_poll_interval"]
+        self._bot_name = self.config["bot"]["name"]
+        self._tz = ZoneInfo(self.config["meeting"]["timezone"])
+        self._meeting_duration = timedelta(minutes=self.config["meeting"]["default_duration"])
+        self._calendar_id = self.config["google"]["calendar_id"]
+    
+    @property
+    def google_service(self):
+        """Return the Calendar client, initializing it on first use"""
+        if not self._google_initialized:
+            self._init_google_calendar()
+        return self._google_service
+    
+    @google_service.setter
+    def google_service(self, service):
+        self._google_service = service
+        self._google_initialized = True
+    
+    def _session_urls(self, session: MeetingSession) -> Dict[str, str]:
+        """Return the session's Vexa endpoint URLs, built once per session"""
+        if session._vexa_urls is None:
+            meet_id = session.google_meet_id
+            urls = {template: self._vexa_url + template.format(id=meet_id)
+                    for template in BOT_STATUS_ENDPOINTS}
+            urls[BOT_LIST_ENDPOINT] = self._bots_url
+            urls['delete'] = f"{self._bots_url}/google_meet/{meet_id}"
+            urls['transcript'] = f"{self._transcripts_url}/{meet_id}"
+            session._vexa_urls = urls
+        return session._vexa_urls
+    
+    def _get_vexa_session(self) -> "requests.Session":
+        """Return the pooled requests session, creating it on first use"""
+        if self._vexa_session is None:
+            self._vexa_session = self._build_vexa_session()
+        return self._vexa_session
+    
+    def _build_vexa_session(self) -> "requests.Session":
+        """Create a pooled keep-alive requests session for synchronous Vexa calls"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # requests adds Content-Type itself for json= bodies
+        session.headers.update(self._vexa_headers)
+        return session
+    
+    def _get_http(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it lazily inside the running loop"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self._vexa_timeout),
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
+        return self._http
+    
+    async def close(self):
+        """Persist pending session changes and close the shared HTTP sessions"""
+        self._save_sessions()
+        self._sessions_db.close()
+        self._executor.shutdown(wait=False)
+        if self._status_runner is not None:
+            await self._status_runner.cleanup()
+        if self._vexa_session is not None:
+            self._vexa_session.close()
+        if self._http and not self._http.closed:
+            await self._http.close()
+    
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration with fallback to environment variables"""
         try:
@@ -116,19 +342,22 @@ class AthenaMeetBot:
                 "name": "Athena",
                 "join_delay": config.get("bot", {}).get("join_delay", 10),
                 "max_retries": config.get("bot", {}).get("max_retries", 3),
-                "transcript_poll_interval": config.get("bot", {}).get("transcript_poll_interval", 30)
+                "transcript_poll_interval": config.get("bot", {}).get("transcript_poll_interval", 30),
+                "status_port": config.get("bot", {}).get("status_port") or os.getenv("ATHENA_STATUS_PORT"),
+                "status_url": config.get("bot", {}).get("status_url") or os.getenv("ATHENA_STATUS_URL")
             },
             "logging": {
                 "level": config.get("logging", {}).get("level", "INFO"),
                 "file": config.get("logging", {}).get("file", "athena_bot.log"),
                 "max_size": config.get("logging", {}).get("max_size", 10485760),  # 10MB
-                "backup_count": config.get("logging", {}).get("backup_count", 5)
+                "backup_count": config.get("logging", {}).get("backup_count", 5),
+                "buffer_capacity": config.get("logging", {}).get("buffer_capacity", 50)
             }
         }
     
     def _setup_logging(self) -> logging.Logger:
         """Setup comprehensive logging"""
-        from logging.handlers import RotatingFileHandler
+        from logging.handlers import MemoryHandler, RotatingFileHandler
         
         log_config = self.config.get("logging", {})
         
@@ -145,6 +374,13 @@ class AthenaMeetBot:
         )
         file_handler.setFormatter(formatter)
         
+        # Buffer file writes, flushing immediately on warnings and errors
+        buffered_file_handler = MemoryHandler(
+            capacity=log_config.get("buffer_capacity", 50),
+            flushLevel=logging.WARNING,
+            target=file_handler
+        )
+        
         # Setup console handler
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
@@ -152,160 +388,365 @@ class AthenaMeetBot:
         # Configure logger
         logger = logging.getLogger("AthenaBot")
         logger.setLevel(getattr(logging, log_config.get("level", "INFO")))
-        logger.addHandler(file_handler)
+        logger.addHandler(buffered_file_handler)
         logger.addHandler(console_handler)
         
         return logger
     
     def _validate_config(self):
         """Validate required configuration parameters"""
-        required_fields = [
-            ("vexa.api_key", "Vexa API key"),
-            ("webhook.url", "Webhook URL"),
+        missing_fields = [
+            description for path, description in REQUIRED_CONFIG
+            if not _config_lookup(self.config, path)
         ]
         
-        missing_fields = []
-        for field_path, description in required_fields:
-            value = self.config
-            for key in field_path.split('.'):
-                value = value.get(key) if isinstance(value, dict) else None
-                if value is None:
-                    break
-            
-            if not value:
-                missing_fields.append(description)
-        
         if missing_fields:
             raise ValueError(f"Missing required configuration: {', '.join(missing_fields)}")
     
+    def _build_calendar_service(self, credentials):
+        """Build the Calendar client from the bundled discovery document"""
+        from googleapiclient.discovery import build
+        
+        # static_discovery avoids fetching the API descriptor over HTTPS on every start
+        return build('calendar', 'v3', credentials=credentials,
+                     cache_discovery=False, static_discovery=True)
+    
+    def _load_oauth_credentials(self, path: str) -> Optional["Credentials"]:
+        """Load OAuth credentials, refreshing and writing them back only when expired"""
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        
+        creds = Credentials.from_authorized_user_file(path)
+        if creds and creds.expired and creds.refresh_token:
+            try:
+                creds.refresh(Request())
+                with open(path, 'w') as f:
+                    f.write(creds.to_json())
+                self.logger.info(f"Refreshed Google OAuth token in {path}")
+            except Exception as e:
+                self.logger.warning(f"Failed to refresh Google OAuth token in {path}: {e}")
+        return creds
+    
     def _init_google_calendar(self):
         """Initialize Google Calendar API service with multiple auth methods"""
+        self._google_initialized = True
         try:
+            from google.oauth2 import service_account
+            
             # Try service account first (recommended for bots)
             if os.path.exists('service_account.json'):
                 credentials = service_account.Credentials.from_service_account_file(
                     'service_account.json',
                     scopes=['https://www.googleapis.com/auth/calendar']
                 )
-                self.google_service = build('calendar', 'v3', credentials=credentials)
+                self.google_service = self._build_calendar_service(credentials)
                 self.logger.info("Google Calendar service initialized with service account")
                 return
             
             # Try OAuth token file
             if os.path.exists('token.json'):
-                with open('token.json', 'r') as f:
-                    creds_data = json.load(f)
-                    creds = Credentials.from_authorized_user_info(creds_data)
-                    if creds and creds.valid:
-                        self.google_service = build('calendar', 'v3', credentials=creds)
-                        self.logger.info("Google Calendar service initialized with OAuth token")
-                        return
+                creds = self._load_oauth_credentials('token.json')
+                if creds and creds.valid:
+                    self.google_service = self._build_calendar_service(creds)
+                    self.logger.info("Google Calendar service initialized with OAuth token")
+                    return
             
             # Fallback to configured credentials path
             creds_path = self.config["google"]["credentials_path"]
             if os.path.exists(creds_path):
-                with open(creds_path, 'r') as f:
-                    creds_data = json.load(f)
-                    creds = Credentials.from_authorized_user_info(creds_data)
-                    self.google_service = build('calendar', 'v3', credentials=creds)
-                    self.logger.info("Google Calendar service initialized with configured credentials")
+                creds = self._load_oauth_credentials(creds_path)
+                self.google_service = self._build_calendar_service(creds)
+                self.logger.info("Google Calendar service initialized with configured credentials")
             else:
                 self.logger.warning("No valid Google credentials found. Calendar features disabled.")
                 
         except Exception as e:
             self.logger.error(f"Failed to initialize Google Calendar service: {e}")
     
+    def _to_meeting_tz(self, when: datetime) -> datetime:
+        """Return the given time as an aware datetime in the meeting timezone"""
+        # Naive meeting times are wall-clock times in the configured meeting timezone
+        if when.tzinfo is None:
+            return when.replace(tzinfo=self._tz)
+        return when.astimezone(self._tz)
+    
+    def _minute_key(self, when: datetime) -> datetime:
+        """Return the minute-resolution key used by the local session index"""
+        return self._to_meeting_tz(when).replace(second=0, microsecond=0)
+    
+    def _index_session(self, session: MeetingSession):
+        """Add a tracked session to the slot index and the scheduler's join and cleanup heaps"""
+        self._sessions_by_minute[self._minute_key(session.start_time)] = session.meeting_id
+        entry = (session.start_time, session.meeting_id)
+        if session.status == MeetingStatus.CREATED:
+            heapq.heappush(self._pending_join_heap, entry)
+        heapq.heappush(self._cleanup_heap, entry)
+    
+    def _unindex_session(self, session: MeetingSession):
+        """Drop a session from the local index if it still owns its slot"""
+        key = self._minute_key(session.start_time)
+        if self._sessions_by_minute.get(key) == session.meeting_id:
+            del self._sessions_by_minute[key]
+    
+    def _has_local_session(self, start_time: datetime) -> bool:
+        """Check whether a tracked session already starts inside the meeting window"""
+        window_start = self._minute_key(start_time)
+        window_end = window_start + self._meeting_duration
+        return any(window_start <= key < window_end for key in self._sessions_by_minute)
+    
+    def _meeting_window(self, start_time: datetime) -> tuple:
+        """Return the (timeMin, timeMax) strings used to look up a meeting slot"""
+        start_time = self._to_meeting_tz(start_time)
+        
+        time_min = start_time.isoformat()
+        time_max = (start_time + self._meeting_duration).isoformat()
+        return time_min, time_max
+    
     async def _check_existing_meeting(self, start_time: datetime) -> bool:
         """Check if a meeting already exists at the given time"""
         if not self.google_service:
             return False
         
+        # A session we already track for this slot answers without a Calendar round-trip
+        if self._has_local_session(start_time):
+            return True
+        
+        # Search for events in the time range (need timezone info)
+        time_min, time_max = self._meeting_window(start_time)
+        cache_key = (self._calendar_id, time_min, time_max)
+        
+        cached = self._meeting_check_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < MEETING_CHECK_TTL:
+            return cached[1]
+        
         try:
-            # Search for events in the time range (need timezone info)
-            time_min = start_time.isoformat() + '+05:30'  # IST timezone
-            time_max = (start_time + timedelta(minutes=self.config["meeting"]["default_duration"])).isoformat() + '+05:30'
-            
             events_result = self.google_service.events().list(
-                calendarId=self.config["google"]["calendar_id"],
+                calendarId=self._calendar_id,
                 timeMin=time_min,
                 timeMax=time_max,
                 singleEvents=True,
-                orderBy='startTime'
+                orderBy='startTime',
+                fields='items(summary,hangoutLink)'
             ).execute()
             
             events = events_result.get('items', [])
             
             # Check if any event contains "Daily Standup" or has Google Meet link
+            exists = False
             for event in events:
-                summary = event.get('summary', '').lower()
-                if 'daily standup' in summary or 'standup' in summary:
-                    return True
+                if STANDUP_TITLE.search(event.get('summary', '')):
+                    exists = True
+                    break
                     
                 # Check if it has a Google Meet link (hangoutLink)
                 if event.get('hangoutLink'):
-                    return True
+                    exists = True
+                    break
             
-            return False
+            self._cache_meeting_check(cache_key, exists)
+            return exists
             
         except Exception as e:
             self.logger.error(f"Failed to check existing meeting: {e}")
             return False
     
+    def _cache_meeting_check(self, cache_key: tuple, exists: bool):
+        """Remember an existing-meeting lookup, evicting expired entries when full"""
+        now = time.monotonic()
+        if len(self._meeting_check_cache) >= MEETING_CHECK_CACHE_SIZE:
+            self._meeting_check_cache = {
+                key: entry for key, entry in self._meeting_check_cache.items()
+                if now - entry[0] < MEETING_CHECK_TTL
+            }
+        self._meeting_check_cache[cache_key] = (now, exists)
+    
+    def _open_sessions_db(self) -> sqlite3.Connection:
+        """Open the session database and create the schema if needed"""
+        conn = sqlite3.connect(self.sessions_file, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                meeting_id TEXT PRIMARY KEY,
+                google_meet_url TEXT,
+                google_meet_id TEXT,
+                start_time TEXT,
+                end_time TEXT,
+                status TEXT,
+                bot_session_id TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_sessions_status ON sessions(status);
+            CREATE INDEX IF NOT EXISTS idx_sessions_start ON sessions(start_time);
+        """)
+        return conn
+    
+    def _import_legacy_sessions(self):
+        """Copy sessions from the old pickle file into a still empty session database"""
+        if not os.path.exists(LEGACY_SESSIONS_FILE):
+            return
+        if self._sessions_db.execute("SELECT 1 FROM sessions LIMIT 1").fetchone():
+            return
+        import pickle
+        
+        try:
+            with open(LEGACY_SESSIONS_FILE, 'rb') as f:
+                sessions_data = pickle.load(f)
+            
+            rows = []
+            for session_dict in sessions_data.values():
+                session = MeetingSession(
+                    meeting_id=session_dict['meeting_id'],
+                    google_meet_url=session_dict['google_meet_url'],
+                    google_meet_id=session_dict['google_meet_id'],
+                    start_time=session_dict['start_time'],
+                    end_time=session_dict.get('end_time'),
+                    status=MeetingStatus(session_dict['status']),
+                    bot_session_id=session_dict.get('bot_session_id')
+                )
+                rows.append(session.to_persist_dict())
+            
+            with self._sessions_db:
+                self._sessions_db.executemany("""
+                    INSERT INTO sessions (
+                        meeting_id, google_meet_url, google_meet_id,
+                        start_time, end_time, status, bot_session_id
+                    ) VALUES (
+                        :meeting_id, :google_meet_url, :google_meet_id,
+                        :start_time, :end_time, :status, :bot_session_id
+                    )
+                """, rows)
+            
+            # Renamed rather than deleted, so the import runs once but the data is kept
+            os.replace(LEGACY_SESSIONS_FILE, LEGACY_SESSIONS_FILE + ".imported")
+            self.logger.info(f"Imported {len(rows)} sessions from {LEGACY_SESSIONS_FILE}")
+        except Exception as e:
+            self.logger.error(f"Failed to import sessions from {LEGACY_SESSIONS_FILE}: {e}")
+    
     def _load_sessions(self):
-        """Load active sessions from disk"""
+        """Load live sessions from the session database"""
         try:
-            if os.path.exists(self.sessions_file):
-                with open(self.sessions_file, 'rb') as f:
-                    sessions_data = pickle.load(f)
-                    for session_id, session_dict in sessions_data.items():
-                        # Recreate MeetingSession objects
-                        session = MeetingSession(
-                            meeting_id=session_dict['meeting_id'],
-                            google_meet_url=session_dict['google_meet_url'],
-                            google_meet_id=session_dict['google_meet_id'],
-                            start_time=session_dict['start_time'],
-                            end_time=session_dict.get('end_time'),
-                            status=MeetingStatus(session_dict['status']),
-                            bot_session_id=session_dict.get('bot_session_id')
-                        )
-                        self._active_sessions[session_id] = session
-                self.logger.info(f"Loaded {len(self._active_sessions)} active sessions")
+            placeholders = ', '.join('?' * len(LIVE_SESSION_STATUSES))
+            rows = self._sessions_db.execute(
+                f"SELECT * FROM sessions WHERE status IN ({placeholders})",
+                LIVE_SESSION_STATUSES
+            ).fetchall()
+            
+            for row in rows:
+                # Recreate MeetingSession objects
+                session = MeetingSession(
+                    meeting_id=row['meeting_id'],
+                    google_meet_url=row['google_meet_url'],
+                    google_meet_id=row['google_meet_id'],
+                    start_time=datetime.fromisoformat(row['start_time']),
+                    end_time=datetime.fromisoformat(row['end_time']) if row['end_time'] else None,
+                    status=MeetingStatus(row['status']),
+                    bot_session_id=row['bot_session_id']
+                )
+                self._active_sessions[session.meeting_id] = session
+                self._index_session(session)
+            self.logger.info(f"Loaded {len(self._active_sessions)} active sessions")
         except Exception as e:
             self.logger.error(f"Failed to load sessions: {e}")
     
+    def _mark_dirty(self, session: MeetingSession):
+        """Flag a tracked session as changed since the last save"""
+        if session.meeting_id in self._active_sessions:
+            self._dirty.add(session.meeting_id)
+    
     def _save_sessions(self):
-        """Save active sessions to disk"""
+        """Write the sessions changed since the last save to the session database"""
+        if not self._dirty:
+            return
+        
         try:
-            sessions_data = {}
-            for session_id, session in self._active_sessions.items():
-                sessions_data[session_id] = {
-                    'meeting_id': session.meeting_id,
-                    'google_meet_url': session.google_meet_url,
-                    'google_meet_id': session.google_meet_id,
-                    'start_time': session.start_time,
-                    'end_time': session.end_time,
-                    'status': session.status.value,
-                    'bot_session_id': session.bot_session_id
-                }
+            upserts = []
+            deletes = []
+            for meeting_id in self._dirty:
+                session = self._active_sessions.get(meeting_id)
+                if session is None:
+                    deletes.append((meeting_id,))
+                else:
+                    upserts.append(session.to_persist_dict())
             
-            with open(self.sessions_file, 'wb') as f:
-                pickle.dump(sessions_data, f)
+            with self._sessions_db:
+                self._sessions_db.executemany("""
+                    INSERT INTO sessions (
+                        meeting_id, google_meet_url, google_meet_id,
+                        start_time, end_time, status, bot_session_id
+                    ) VALUES (
+                        :meeting_id, :google_meet_url, :google_meet_id,
+                        :start_time, :end_time, :status, :bot_session_id
+                    )
+                    ON CONFLICT(meeting_id) DO UPDATE SET
+                        google_meet_url = excluded.google_meet_url,
+                        google_meet_id = excluded.google_meet_id,
+                        start_time = excluded.start_time,
+                        end_time = excluded.end_time,
+                        status = excluded.status,
+                        bot_session_id = excluded.bot_session_id
+                """, upserts)
+                self._sessions_db.executemany(
+                    "DELETE FROM sessions WHERE meeting_id = ?", deletes
+                )
+            self._dirty.clear()
         except Exception as e:
             self.logger.error(f"Failed to save sessions: {e}")
     
+    def _standup_window(self, date: datetime) -> tuple:
+        """Return the (start, end) datetimes of the standup on the given date"""
+        standup_time = self.config["meeting"]["standup_time"]
+        hour, minute = map(int, standup_time.split(':'))
+        
+        meeting_start = date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        meeting_end = meeting_start + self._meeting_duration
+        return meeting_start, meeting_end
+    
+    def _fallback_meet_info(self) -> Optional[Dict]:
+        """Return the constant meeting link used when calendar creation fails"""
+        constant_url = self.config["meeting"].get("constant_meeting_url")
+        constant_id = self.config["meeting"].get("constant_meeting_id")
+        
+        if constant_url and constant_id:
+            self.logger.warning(f"Calendar creation failed, using constant meeting link: {constant_url}")
+            return {
+                "meet_url": constant_url,
+                "meet_id": constant_id
+            }
+        
+        self.logger.error("Failed to create calendar event and no constant meeting URL configured")
+        return None
+    
+    def _new_id(self) -> str:
+        """Return a random 128-bit hex identifier"""
+        return os.urandom(16).hex()
+    
+    def _register_session(self, meet_info: Dict, meeting_start: datetime) -> MeetingSession:
+        """Create and track a session for a newly created meeting; callers save once"""
+        session = MeetingSession(
+            meeting_id=self._new_id(),
+            google_meet_url=meet_info["meet_url"],
+            google_meet_id=meet_info["meet_id"],
+            start_time=meeting_start,
+            end_time=None,
+            status=MeetingStatus.CREATED
+        )
+        
+        self._active_sessions[session.meeting_id] = session
+        self._index_session(session)
+        self._mark_dirty(session)
+        self._wake_scheduler()
+        self.logger.info(f"Created standup meeting: {session.meeting_id} at {meeting_start}")
+        
+        return session
+    
     async def create_daily_standup(self, date: Optional[datetime] = None) -> Optional[MeetingSession]:
         """Create a daily standup meeting"""
         if date is None:
             date = datetime.now()
         
         try:
-            # Parse standup time
-            standup_time = self.config["meeting"]["standup_time"]
-            hour, minute = map(int, standup_time.split(':'))
-            
-            # Create meeting datetime
-            meeting_start = date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            meeting_end = meeting_start + timedelta(minutes=self.config["meeting"]["default_duration"])
+            meeting_start, meeting_end = self._standup_window(date)
             
             # Check if meeting already exists
             if await self._check_existing_meeting(meeting_start):
@@ -318,39 +759,69 @@ class AthenaMeetBot:
             meet_info = await self._create_google_meet(meeting_start, meeting_end)
             if not meet_info:
                 # Fallback to constant meeting link if calendar creation fails
-                constant_url = self.config["meeting"].get("constant_meeting_url")
-                constant_id = self.config["meeting"].get("constant_meeting_id")
-                
-                if constant_url and constant_id:
-                    meet_info = {
-                        "meet_url": constant_url,
-                        "meet_id": constant_id
-                    }
-                    self.logger.warning(f"Calendar creation failed, using constant meeting link: {constant_url}")
-                else:
-                    self.logger.error("Failed to create calendar event and no constant meeting URL configured")
+                meet_info = self._fallback_meet_info()
+                if not meet_info:
                     return None
             
-            # Create session
-            session = MeetingSession(
-                meeting_id=str(uuid.uuid4()),
-                google_meet_url=meet_info["meet_url"],
-                google_meet_id=meet_info["meet_id"],
-                start_time=meeting_start,
-                end_time=None,
-                status=MeetingStatus.CREATED
-            )
-            
-            self._active_sessions[session.meeting_id] = session
+            session = self._register_session(meet_info, meeting_start)
             self._save_sessions()  # Persist session to disk
-            self.logger.info(f"Created standup meeting: {session.meeting_id} at {meeting_start}")
-            
             return session
             
         except Exception as e:
             self.logger.error(f"Failed to create daily standup: {e}")
             return None
     
+    def _build_standup_event(self, start_time: datetime, end_time: datetime) -> Dict:
+        """Build the Google Calendar event body for a standup with a Meet link"""
+        return {
+            'summary': 'Daily Standup - Categories',
+            'description': 'Automated daily standup meeting with Athena bot transcription',
+            'start': {
+                'dateTime': start_time.isoformat(),
+                'timeZone': self.config["meeting"]["timezone"],
+            },
+            'end': {
+                'dateTime': end_time.isoformat(),
+                'timeZone': self.config["meeting"]["timezone"],
+            },
+            'attendees': [
+                {'email': email} for email in self.config["meeting"]["attendees"]
+            ],
+            'conferenceData': {
+                'createRequest': {
+                    'requestId': self._new_id(),
+                    'conferenceSolutionKey': {'type': 'hangoutsMeet'}
+                }
+            },
+            'reminders': {
+                'useDefault': False,
+                'overrides': [
+                    {'method': 'email', 'minutes': 10},
+                    {'method': 'popup', 'minutes': 5},
+                ],
+            },
+        }
+    
+    def _meet_info_from_event(self, created_event: Dict) -> Dict:
+        """Extract Google Meet details from an inserted calendar event"""
+        conference_data = created_event.get('conferenceData', {})
+        meet_url = conference_data.get('entryPoints', [{}])[0].get('uri', '')
+        meet_id = meet_url.split('/')[-1] if meet_url else ''
+        
+        self.logger.info(f"Created Google Calendar event: {created_event['id']}")
+        
+        return {
+            "event_id": created_event['id'],
+            "meet_url": meet_url,
+            "meet_id": meet_id
+        }
+    
+    def _forget_meeting_check(self, start_time: datetime):
+        """Drop the cached existing-meeting answer for a slot that now has an event"""
+        self._meeting_check_cache.pop(
+            (self._calendar_id, *self._meeting_window(start_time)), None
+        )
+    
     async def _create_google_meet(self, start_time: datetime, end_time: datetime) -> Optional[Dict]:
         """Create Google Calendar event with Meet link"""
         if not self.google_service:
@@ -358,54 +829,21 @@ class AthenaMeetBot:
             
             return None
         
+        # Loaded with the Calendar client above
+        from googleapiclient.errors import HttpError
+        
         try:
-            event = {
-                'summary': 'Daily Standup - Categories',
-                'description': 'Automated daily standup meeting with Athena bot transcription',
-                'start': {
-                    'dateTime': start_time.isoformat(),
-                    'timeZone': self.config["meeting"]["timezone"],
-                },
-                'end': {
-                    'dateTime': end_time.isoformat(),
-                    'timeZone': self.config["meeting"]["timezone"],
-                },
-                'attendees': [
-                    {'email': email} for email in self.config["meeting"]["attendees"]
-                ],
-                'conferenceData': {
-                    'createRequest': {
-                        'requestId': str(uuid.uuid4()),
-                        'conferenceSolutionKey': {'type': 'hangoutsMeet'}
-                    }
-                },
-                'reminders': {
-                    'useDefault': False,
-                    'overrides': [
-                        {'method': 'email', 'minutes': 10},
-                        {'method': 'popup', 'minutes': 5},
-                    ],
-                },
-            }
-            
             created_event = self.google_service.events().insert(
-                calendarId=self.config["google"]["calendar_id"],
-                body=event,
-                conferenceDataVersion=1
+                calendarId=self._calendar_id,
+                body=self._build_standup_event(start_time, end_time),
+                conferenceDataVersion=1,
+                fields='id,conferenceData/entryPoints/uri'
             ).execute()
             
-            # Extract Google Meet details
-            conference_data = created_event.get('conferenceData', {})
-            meet_url = conference_data.get('entryPoints', [{}])[0].get('uri', '')
-            meet_id = meet_url.split('/')[-1] if meet_url else ''
+            # The slot is taken now, drop any cached "no meeting" answer for it
+            self._forget_meeting_check(start_time)
             
-            self.logger.info(f"Created Google Calendar event: {created_event['id']}")
-            
-            return {
-                "event_id": created_event['id'],
-                "meet_url": meet_url,
-                "meet_id": meet_id
-            }
+            return self._meet_info_from_event(created_event)
             
         except HttpError as e:
             self.logger.error(f"Google Calendar API error: {e}")
@@ -414,15 +852,53 @@ class AthenaMeetBot:
             self.logger.error(f"Failed to create Google Meet: {e}")
             return None
     
+    def _batch_create_google_meets(self, slots: List[tuple]) -> Dict[datetime, Dict]:
+        """Create calendar events for several (start, end) slots using batch requests"""
+        meet_infos: Dict[datetime, Dict] = {}
+        if not self.google_service or not slots:
+            return meet_infos
+        
+        starts = {start_time.isoformat(): start_time for start_time, _ in slots}
+        
+        def on_insert(request_id, response, exception):
+            if exception is not None:
+                self.logger.error(f"Google Calendar batch insert failed for {request_id}: {exception}")
+                return
+            start_time = starts[request_id]
+            self._forget_meeting_check(start_time)
+            meet_infos[start_time] = self._meet_info_from_event(response)
+        
+        for i in range(0, len(slots), CALENDAR_BATCH_SIZE):
+            batch = self.google_service.new_batch_http_request(callback=on_insert)
+            for start_time, end_time in slots[i:i + CALENDAR_BATCH_SIZE]:
+                batch.add(
+                    self.google_service.events().insert(
+                        calendarId=self._calendar_id,
+                        body=self._build_standup_event(start_time, end_time),
+                        conferenceDataVersion=1,
+                        fields='id,conferenceData/entryPoints/uri'
+                    ),
+                    request_id=start_time.isoformat()
+                )
+            
+            try:
+                batch.execute()
+            except Exception as e:
+                self.logger.error(f"Google Calendar batch request failed: {e}")
+        
+        return meet_infos
+    
     async def join_meeting_with_athena(self, session: MeetingSession) -> bool:
         """Send Athena bot to join the meeting via Vexa API with proper session management"""
         try:
             session.status = MeetingStatus.BOT_JOINING
+            self._mark_dirty(session)
             
             # First, check if bot is already active in this meeting
-            if self._verify_bot_active(session):
+            if await self._verify_bot_active(session):
                 self.logger.info(f"Bot already active in meeting {session.meeting_id}")
                 session.status = MeetingStatus.IN_PROGRESS
+                self._mark_dirty(session)
                 return True
             
             # If there's an existing bot session that's not active, clean it up
@@ -430,20 +906,19 @@ class AthenaMeetBot:
                 self.logger.info(f"Cleaning up inactive bot session: {session.bot_session_id}")
                 await self._delete_bot(session)
                 session.bot_session_id = None
+                self._mark_dirty(session)
                 await asyncio.sleep(2)  # Wait for cleanup
             
             # Wait for join delay
             await asyncio.sleep(self.config["bot"]["join_delay"])
             
             # Create bot via Vexa API using the correct authentication method
-            api_key = self.config["vexa"]["api_key"]
-            
             payload = {
                 "platform": "google_meet",
                 "meeting_url": session.google_meet_url,
                 "native_meeting_id": session.google_meet_id,
-                "webhook_url": self.config["webhook"]["url"],
-                "name": self.config["bot"]["name"],
+                "webhook_url": self._bot_webhook_url,
+                "name": self._bot_name,
                 "wait_for_host": False,  # Don't wait for host, join immediately
                 "auto_leave_on_empty": False,  # Don't auto-leave, stay persistent
                 "wait_for_admission": True,  # Wait for manual admission
@@ -452,88 +927,126 @@ class AthenaMeetBot:
                 "retry_on_disconnect": True  # Retry if disconnected
             }
             
-            headers = {
-                'X-API-Key': api_key,
-                'Content-Type': 'application/json'
-            }
-            
-            response = requests.post(
-                f"{self.config['vexa']['base_url']}/bots",
-                headers=headers,
-                json=payload,
-                timeout=self.config["vexa"]["timeout"]
-            )
-            
-            if response.status_code in [200, 201]:
-                bot_data = response.json()
-                session.bot_session_id = bot_data.get("id", bot_data.get("bot_id"))
-                
-                self.logger.info(f"Bot created and waiting for admission: {session.meeting_id} with bot_id: {session.bot_session_id}")
-                
-                # Start monitoring admission immediately (don't block)
-                asyncio.create_task(self._monitor_bot_admission(session))
-                
-                # Mark as joining and let the monitoring handle the rest
-                session.status = MeetingStatus.BOT_JOINING
-                self.logger.info(f"🔄 Bot created, monitoring admission status...")
-                
-                return True  # Return success immediately, monitor in background
-            elif response.status_code == 409:
-                # Bot already exists, try to get existing bot info
-                self.logger.warning(f"Bot already exists for meeting {session.google_meet_id}, attempting to verify")
-                if self._verify_bot_active(session):
-                    session.status = MeetingStatus.IN_PROGRESS
-                    return True
+            async with self._get_http().post(
+                self._bots_url,
+                headers=self._vexa_json_headers,
+                json=payload
+            ) as response:
+                if response.status in [200, 201]:
+                    bot_data = await response.json(content_type=None, loads=orjson.loads)
+                    session.bot_session_id = bot_data.get("id", bot_data.get("bot_id"))
+                    
+                    self.logger.info(f"Bot created and waiting for admission: {session.meeting_id} with bot_id: {session.bot_session_id}")
+                    
+                    # Start monitoring admission immediately (don't block)
+                    asyncio.create_task(self._monitor_bot_admission(session))
+                    
+                    # Mark as joining and let the monitoring handle the rest
+                    session.status = MeetingStatus.BOT_JOINING
+                    self._mark_dirty(session)
+                    self.logger.info(f"🔄 Bot created, monitoring admission status...")
+                    
+                    return True  # Return success immediately, monitor in background
+                elif response.status == 409:
+                    # Bot already exists, try to get existing bot info
+                    self.logger.warning(f"Bot already exists for meeting {session.google_meet_id}, attempting to verify")
+                    if await self._verify_bot_active(session):
+                        session.status = MeetingStatus.IN_PROGRESS
+                        self._mark_dirty(session)
+                        return True
+                    else:
+                        raise Exception(f"Bot exists but not active: {await response.text()}")
                 else:
-                    raise Exception(f"Bot exists but not active: {response.text}")
-            else:
-                raise Exception(f"Vexa API error: {response.status_code} - {response.text}")
+                    raise Exception(f"Vexa API error: {response.status} - {await response.text()}")
                 
         except Exception as e:
             session.status = MeetingStatus.FAILED
+            self._mark_dirty(session)
             session.error_message = str(e)
             self.logger.error(f"Failed to join meeting {session.meeting_id}: {e}")
             return False
     
-    async def _monitor_transcript(self, session: MeetingSession):
-        """Monitor and retrieve transcript from Vexa API"""
-        poll_interval = self.config["bot"]["transcript_poll_interval"]
+    def _monitor_transcript(self, session: MeetingSession):
+        """Register a session for transcript polling, starting the shared poller if needed"""
+        self._monitored_sessions[session.meeting_id] = session
+        if self._transcript_task is None or self._transcript_task.done():
+            self._transcript_task = asyncio.create_task(self._poll_transcripts())
+    
+    async def _poll_transcripts(self):
+        """Poll Vexa for all monitored sessions together until none remain"""
+        poll_interval = self._poll_interval
+        loop = asyncio.get_running_loop()
         
-        while session.status == MeetingStatus.IN_PROGRESS:
-            try:
+        while self._monitored_sessions:
+            now = datetime.now()
+            live, ended = [], []
+            for session in self._monitored_sessions.values():
                 # Check if meeting has ended (simple time-based check)
-                if datetime.now() > session.start_time + timedelta(hours=2):  # Max 2 hour meeting
-                    break
-                
-                # Poll for transcript
-                headers = {'X-API-Key': self.config["vexa"]["api_key"]}
-                
-                response = requests.get(
-                    f"{self.config['vexa']['base_url']}/v1/transcripts/google_meet/{session.google_meet_id}",
-                    headers=headers,
-                    timeout=self.config["vexa"]["timeout"]
+                if (session.status != MeetingStatus.IN_PROGRESS or
+                        now > session.start_time + timedelta(hours=2)):  # Max 2 hour meeting
+                    ended.append(session)
+                else:
+                    live.append(session)
+            
+            if ended:
+                # Meetings ended, finalize transcripts without holding up the others
+                for session in ended:
+                    del self._monitored_sessions[session.meeting_id]
+                asyncio.create_task(self._finalize_meetings(ended))
+            
+            if live:
+                due = [session for session in live if session.next_poll_at <= loop.time()]
+                results = await asyncio.gather(
+                    *(self._fetch_transcript(session) for session in due),
+                    return_exceptions=True
                 )
+                for session, result in zip(due, results):
+                    if isinstance(result, Exception):
+                        self.logger.error("Error monitoring transcript for %s: %s", session.meeting_id, result)
+                    
+                    # Back off while the transcript is unchanged, reset as soon as it grows
+                    backoff = 2 ** min(session.consecutive_unchanged, 10)
+                    session.next_poll_at = loop.time() + min(poll_interval * backoff, MAX_TRANSCRIPT_POLL_INTERVAL)
                 
-                if response.status_code == 200:
-                    transcript_data = response.json()
-                    if transcript_data and transcript_data.get("transcript"):
-                        session.transcript = transcript_data["transcript"]
-                        self.logger.info(f"Retrieved transcript for meeting: {session.meeting_id}")
-                
-                await asyncio.sleep(poll_interval)
-                
-            except Exception as e:
-                self.logger.error(f"Error monitoring transcript for {session.meeting_id}: {e}")
-                await asyncio.sleep(poll_interval)
+                # Wake for the next due poll, but re-check meeting state at least every base interval
+                next_poll_at = min(session.next_poll_at for session in live)
+                await asyncio.sleep(max(0, min(poll_interval, next_poll_at - loop.time())))
+    
+    async def _fetch_transcript(self, session: MeetingSession):
+        """Fetch the current transcript for a session from Vexa API"""
+        headers = self._vexa_headers
+        if session.transcript_etag:
+            headers = {**self._vexa_headers, 'If-None-Match': session.transcript_etag}
+        
+        async with self._get_http().get(
+            self._session_urls(session)['transcript'],
+            headers=headers
+        ) as response:
+            if response.status == 200:
+                session.transcript_etag = response.headers.get('ETag')
+                transcript_data = await response.json(content_type=None, loads=orjson.loads)
+                if transcript_data and transcript_data.get("transcript"):
+                    session.transcript = transcript_data["transcript"]
         
-        # Meeting ended, finalize transcript
-        await self._finalize_meeting(session)
+        # 304 Not Modified and failed polls leave the transcript as it was
+        transcript_len = len(session.transcript or '')
+        if transcript_len > session.last_transcript_len:
+            session.last_transcript_len = transcript_len
+            session.consecutive_unchanged = 0
+            self.logger.info("Retrieved transcript for meeting: %s", session.meeting_id)
+        else:
+            session.consecutive_unchanged += 1
+    
+    async def _finalize_meetings(self, sessions: List[MeetingSession]):
+        """Finalize several meetings concurrently"""
+        await asyncio.gather(*(self._finalize_meeting(session) for session in sessions))
     
     async def _finalize_meeting(self, session: MeetingSession):
         """Finalize meeting and deliver transcript via webhook"""
         try:
             session.end_time = datetime.now()
             session.status = MeetingStatus.COMPLETED
+            self._mark_dirty(session)
             
             # Get final transcript
             if not session.transcript:
@@ -546,25 +1059,22 @@ class AthenaMeetBot:
             
         except Exception as e:
             session.status = MeetingStatus.FAILED
+            self._mark_dirty(session)
             session.error_message = str(e)
             self.logger.error(f"Failed to finalize meeting {session.meeting_id}: {e}")
     
     async def _get_final_transcript(self, session: MeetingSession):
         """Get final complete transcript from Vexa API"""
         try:
-            headers = {'X-API-Key': self.config["vexa"]["api_key"]}
-            
-            response = requests.get(
-                f"{self.config['vexa']['base_url']}/v1/transcripts/google_meet/{session.google_meet_id}",
-                headers=headers,
-                timeout=self.config["vexa"]["timeout"]
-            )
-            
-            if response.status_code == 200:
-                transcript_data = response.json()
-                session.transcript = transcript_data.get("transcript", "No transcript available")
-            else:
-                session.transcript = f"Error retrieving transcript: {response.status_code}"
+            async with self._get_http().get(
+                self._session_urls(session)['transcript'],
+                headers=self._vexa_headers
+            ) as response:
+                if response.status == 200:
+                    transcript_data = await response.json(content_type=None, loads=orjson.loads)
+                    session.transcript = transcript_data.get("transcript", "No transcript available")
+                else:
+                    session.transcript = f"Error retrieving transcript: {response.status}"
                 
         except Exception as e:
             session.transcript = f"Error retrieving transcript: {str(e)}"
@@ -572,58 +1082,78 @@ class AthenaMeetBot:
     
     async def _deliver_transcript_webhook(self, session: MeetingSession):
         """Deliver transcript to configured webhook with retries"""
-        webhook_config = self.config["webhook"]
-        max_retries = webhook_config["retry_attempts"]
+        max_retries = self._webhook_retry
         
+        # Datetimes are written as ISO 8601 by the session's orjson encoder
         payload = {
             "meeting_id": session.meeting_id,
             "google_meet_url": session.google_meet_url,
-            "start_time": session.start_time.isoformat(),
-            "end_time": session.end_time.isoformat() if session.end_time else None,
+            "start_time": session.start_time,
+            "end_time": session.end_time,
             "transcript": session.transcript,
-            "bot_name": self.config["bot"]["name"],
+            "bot_name": self._bot_name,
             "status": session.status.value,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
         
-        headers = {'Content-Type': 'application/json'}
-        if webhook_config.get("secret"):
-            headers['X-Webhook-Secret'] = webhook_config["secret"]
-        
         for attempt in range(max_retries):
             try:
-                response = requests.post(
-                    webhook_config["url"],
-                    headers=headers,
+                async with self._get_http().post(
+                    self._webhook_url,
+                    headers=self._webhook_headers,
                     json=payload,
-                    timeout=webhook_config["timeout"]
-                )
-                
-                if response.status_code == 200:
-                    self.logger.info(f"Transcript delivered successfully for meeting: {session.meeting_id}")
-                    return
-                else:
-                    raise Exception(f"Webhook responded with status: {response.status_code}")
+                    timeout=self._webhook_timeout
+                ) as response:
+                    # Receivers may acknowledge with 202 and process in the background
+                    if response.status in (200, 202):
+                        self.logger.info(f"Transcript delivered successfully for meeting: {session.meeting_id}")
+                        return
+                    else:
+                        raise Exception(f"Webhook responded with status: {response.status}")
                     
             except Exception as e:
                 self.logger.warning(f"Webhook delivery attempt {attempt + 1} failed for {session.meeting_id}: {e}")
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                    # Full jitter keeps simultaneous finalizations from retrying in lockstep
+                    backoff = min(WEBHOOK_BACKOFF_CAP, WEBHOOK_BACKOFF_BASE * 2 ** attempt)
+                    await asyncio.sleep(random.uniform(0, backoff))
                 else:
                     self.logger.error(f"All webhook delivery attempts failed for {session.meeting_id}")
     
     def schedule_daily_standups(self):
-        """Schedule daily standup meetings"""
+        """Schedule daily standup meetings on the running event loop"""
         standup_time = self.config["meeting"]["standup_time"]
         
-        def run_daily_standup():
-            # Synchronous workflow to avoid asyncio conflicts
-            self._daily_standup_workflow_sync()
-        
-        schedule.every().day.at(standup_time).do(run_daily_standup)
+        if self._daily_timer_task is None or self._daily_timer_task.done():
+            self._daily_timer_task = asyncio.create_task(self._daily_timer())
         
         self.logger.info(f"Scheduled daily standups at {standup_time} (every day)")
     
+    def _next_standup_time(self, now: datetime) -> datetime:
+        """Return the next time the daily standup trigger should fire"""
+        standup_time = self.config["meeting"]["standup_time"]
+        hour, minute = map(int, standup_time.split(':'))
+        
+        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if target <= now:
+            target += timedelta(days=1)
+        return target
+    
+    async def _daily_timer(self):
+        """Sleep until each daily standup and run the standup workflow"""
+        while True:
+            target = self._next_standup_time(datetime.now())
+            await asyncio.sleep((target - datetime.now()).total_seconds())
+            
+            self.logger.info(f"Time trigger activated: {datetime.now().strftime('%H:%M:%S')}")
+            try:
+                # The workflow does blocking HTTP, keep it off the event loop
+                await asyncio.get_running_loop().run_in_executor(
+                    self._executor, self._daily_standup_workflow_sync
+                )
+            except Exception as e:
+                self.logger.error(f"Daily standup workflow failed: {e}")
+    
     def _daily_standup_workflow_sync(self):
         """Synchronous workflow for daily standup - directly join constant meeting"""
         try:
@@ -638,26 +1168,23 @@ class AthenaMeetBot:
             self.logger.info(f"Time trigger: joining constant meeting {constant_url}")
             
             # Direct API call to join meeting
-            api_key = self.config["vexa"]["api_key"]
-            webhook_url = self.config["webhook"]["url"]
-            
             payload = {
                 "platform": "google_meet",
                 "meeting_url": constant_url,
                 "native_meeting_id": constant_id,
-                "webhook_url": webhook_url,
-                "name": self.config["bot"]["name"]
+                "webhook_url": self._bot_webhook_url,
+                "name": self._bot_name
             }
             
-            response = requests.post(
-                f"{self.config['vexa']['base_url']}/bots",
-                headers={'X-API-Key': api_key, 'Content-Type': 'application/json'},
-                json=payload,
+            response = self._get_vexa_session().post(
+                self._bots_url,
+                data=orjson.dumps(payload),
+                headers={'Content-Type': 'application/json'},
                 timeout=30
             )
             
             if response.status_code in [200, 201]:
-                bot_data = response.json()
+                bot_data = orjson.loads(response.content)
                 self.logger.info(f"✅ Bot successfully joined meeting: {bot_data.get('id')}")
                 self.logger.info(f"Meeting URL: {constant_url}")
             else:
@@ -676,7 +1203,7 @@ class AthenaMeetBot:
                 return
             
             # Schedule bot to join meeting
-            asyncio.create_task(self._schedule_bot_join(session))
+            self._queue_bot_join(session)
             
         except Exception as e:
             self.logger.error(f"Daily standup workflow failed: {e}")
@@ -685,21 +1212,42 @@ class AthenaMeetBot:
         """Create meetings for next N days"""
         created_meetings = []
         
+        # Find the days that still need a meeting
+        slots = []
         for i in range(days):
             date = datetime.now() + timedelta(days=i)
             try:
-                session = await self.create_daily_standup(date)
-                if session:
+                meeting_start, meeting_end = self._standup_window(date)
+                if await self._check_existing_meeting(meeting_start):
+                    self.logger.info(f"Meeting already exists at {meeting_start}, skipping creation")
+                    print(f"⏭️  Day {i+1}: Meeting already exists at {meeting_start}")
+                    continue
+                slots.append((i + 1, meeting_start, meeting_end))
+            except Exception as e:
+                self.logger.error(f"Failed to create meeting for day {i+1}: {e}")
+                print(f"❌ Day {i+1}: Error - {e}")
+        
+        # Insert all calendar events in batched requests
+        meet_infos = self._batch_create_google_meets([(start, end) for _, start, end in slots])
+        
+        for day, meeting_start, _ in slots:
+            try:
+                meet_info = meet_infos.get(meeting_start) or self._fallback_meet_info()
+                if meet_info:
+                    session = self._register_session(meet_info, meeting_start)
                     created_meetings.append(session)
-                    self.logger.info(f"Created meeting {i+1}/{days}: {session.google_meet_url}")
-                    print(f"✅ Day {i+1}: {session.google_meet_url} (Bot joins at {session.start_time})")
+                    self.logger.info(f"Created meeting {day}/{days}: {session.google_meet_url}")
+                    print(f"✅ Day {day}: {session.google_meet_url} (Bot joins at {session.start_time})")
                     # Schedule bot to join at meeting start time
-                    asyncio.create_task(self._schedule_bot_join(session))
+                    self._queue_bot_join(session)
                 else:
-                    print(f"❌ Day {i+1}: Failed to create meeting")
+                    print(f"❌ Day {day}: Failed to create meeting")
             except Exception as e:
-                self.logger.error(f"Failed to create meeting for day {i+1}: {e}")
-                print(f"❌ Day {i+1}: Error - {e}")
+                self.logger.error(f"Failed to create meeting for day {day}: {e}")
+                print(f"❌ Day {day}: Error - {e}")
+        
+        # Persist all new sessions in one write
+        self._save_sessions()
         
         print(f"\n🎉 Created {len(created_meetings)} meetings for next {days} days")
         return created_meetings
@@ -712,39 +1260,70 @@ class AthenaMeetBot:
         
         try:
             # Get events for next 30 days
-            now = datetime.now()
-            time_min = now.isoformat() + '+05:30'  # IST timezone
-            time_max = (now + timedelta(days=30)).isoformat() + '+05:30'
+            now = datetime.now(self._tz)
+            time_min = now.isoformat()
+            time_max = (now + timedelta(days=30)).isoformat()
             
-            events_result = self.google_service.events().list(
-                calendarId=self.config["google"]["calendar_id"],
-                timeMin=time_min,
-                timeMax=time_max,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
+            # Page through the window, asking only for the fields used below
+            events = []
+            page_token = None
+            while True:
+                events_result = self.google_service.events().list(
+                    calendarId=self._calendar_id,
+                    timeMin=time_min,
+                    timeMax=time_max,
+                    singleEvents=True,
+                    orderBy='startTime',
+                    maxResults=250,
+                    pageToken=page_token,
+                    fields='items(id,summary,hangoutLink,start/dateTime),nextPageToken'
+                ).execute()
+                events.extend(events_result.get('items', []))
+                page_token = events_result.get('nextPageToken')
+                if not page_token:
+                    break
             
-            events = events_result.get('items', [])
             deleted_count = 0
             
             print("🗑️  Searching for standup meetings to delete...")
             
-            for event in events:
-                summary = event.get('summary', '').lower()
-                # Delete events that contain "standup" in title or have Google Meet links
-                if 'standup' in summary or event.get('hangoutLink'):
-                    try:
+            # Delete events that contain "standup" in title or have Google Meet links
+            targets = {
+                event['id']: event for event in events
+                if STANDUP_TITLE.search(event.get('summary', '')) or event.get('hangoutLink')
+            }
+            
+            def on_delete(request_id, response, exception):
+                nonlocal deleted_count
+                event = targets[request_id]
+                if exception is not None:
+                    print(f"❌ Failed to delete event: {event.get('summary', 'Untitled')} - {exception}")
+                    return
+                deleted_count += 1
+                event_time = event.get('start', {}).get('dateTime', 'Unknown time')
+                print(f"🗑️  Deleted: {event.get('summary', 'Untitled')} at {event_time}")
+            
+            event_ids = list(targets)
+            for i in range(0, len(event_ids), CALENDAR_BATCH_SIZE):
+                batch = self.google_service.new_batch_http_request(callback=on_delete)
+                for event_id in event_ids[i:i + CALENDAR_BATCH_SIZE]:
+                    batch.add(
                         self.google_service.events().delete(
-                            calendarId=self.config["google"]["calendar_id"],
-                            eventId=event['id']
-                        ).execute()
-                        
-                        deleted_count += 1
-                        event_time = event.get('start', {}).get('dateTime', 'Unknown time')
-                        print(f"🗑️  Deleted: {event.get('summary', 'Untitled')} at {event_time}")
-                        
-                    except Exception as e:
-                        print(f"❌ Failed to delete event: {event.get('summary', 'Untitled')} - {e}")
+                            calendarId=self._calendar_id,
+                            eventId=event_id
+                        ),
+                        request_id=event_id
+                    )
+                
+                try:
+                    batch.execute()
+                except Exception as e:
+                    print(f"❌ Batch delete request failed: {e}")
+                    self.logger.error(f"Google Calendar batch delete failed: {e}")
+            
+            if deleted_count:
+                # Cached existing-meeting answers may point at events that are gone now
+                self._meeting_check_cache.clear()
             
             print(f"\n✅ Deleted {deleted_count} standup meetings")
             
@@ -752,14 +1331,31 @@ class AthenaMeetBot:
             print(f"❌ Failed to delete meetings: {e}")
             self.logger.error(f"Failed to delete meetings: {e}")
     
-    async def _schedule_bot_join(self, session: MeetingSession):
+    def _queue_bot_join(self, session: MeetingSession):
         """Schedule bot to join meeting at start time"""
-        now = datetime.now()
-        if session.start_time > now:
-            wait_seconds = (session.start_time - now).total_seconds()
-            await asyncio.sleep(wait_seconds)
+        heapq.heappush(self._join_heap, (session.start_time, session.meeting_id))
         
-        await self.join_meeting_with_athena(session)
+        if self._join_task is None or self._join_task.done():
+            self._join_task = asyncio.create_task(self._run_join_queue())
+        elif self._join_heap[0][1] == session.meeting_id:
+            # The new join is now the earliest, restart the wait with the shorter delay
+            self._join_task.cancel()
+            self._join_task = asyncio.create_task(self._run_join_queue())
+    
+    async def _run_join_queue(self):
+        """Sleep until the earliest queued join is due and start it"""
+        while self._join_heap:
+            start_time, meeting_id = self._join_heap[0]
+            wait_seconds = (start_time - datetime.now()).total_seconds()
+            if wait_seconds > 0:
+                await asyncio.sleep(wait_seconds)
+                continue
+            
+            heapq.heappop(self._join_heap)
+            session = self._active_sessions.get(meeting_id)
+            # Skip sessions that were cleaned up or already joined by the scheduler
+            if session and session.status == MeetingStatus.CREATED:
+                asyncio.create_task(self.join_meeting_with_athena(session))
     
     def get_session_status(self, meeting_id: str) -> Optional[Dict]:
         """Get status of a specific meeting session"""
@@ -778,76 +1374,78 @@ class AthenaMeetBot:
             "retry_count": session.retry_count
         }
     
-    def run_scheduler(self):
+    async def run_scheduler(self):
         """Run the meeting scheduler with session monitoring"""
         self.logger.info("Starting Athena meeting scheduler...")
+        # Created here so the event belongs to the running loop
+        self._wakeup = asyncio.Event()
         
-        # Get target time
         standup_time = self.config["meeting"]["standup_time"]
-        target_hour, target_minute = map(int, standup_time.split(':'))
-        
         self.logger.info(f"Monitoring for standup at {standup_time}")
         
-        meeting_created = False
-        
         while True:
             try:
-                now = datetime.now()
-                current_hour = now.hour
-                current_minute = now.minute
-                
-                # Check if it's time for the meeting
-                if (current_hour == target_hour and current_minute == target_minute and not meeting_created):
-                    self.logger.info(f"Time trigger activated: {now.strftime('%H:%M:%S')}")
-                    self._daily_standup_workflow_sync()
-                    meeting_created = True
-                
-                # Reset flag for next day
-                elif current_hour != target_hour or current_minute != target_minute:
-                    meeting_created = False
+                # Read the clock once per wake; the helpers below share it
+                self._tick_now = datetime.now()
                 
                 # Check for pending joins
-                self._check_pending_joins()
+                await self._check_pending_joins()
                 
-                time.sleep(5)  # Check every 5 seconds for accuracy
+                # Sleep until the next join or cleanup deadline, or until woken early
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=self._next_scheduler_delay(self._tick_now)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
                 
-            except KeyboardInterrupt:
+            except asyncio.CancelledError:
                 self.logger.info("Scheduler stopped by user")
-                break
+                raise
             except Exception as e:
                 self.logger.error(f"Scheduler error: {e}")
-                time.sleep(10)
+                await asyncio.sleep(10)
+    
+    def _wake_scheduler(self):
+        """Make the scheduler recompute its next deadline right away"""
+        if self._wakeup is not None:
+            self._wakeup.set()
     
-    def _check_pending_joins(self):
+    def _next_scheduler_delay(self, now: datetime) -> float:
+        """Return seconds until the scheduler next has a session to join or clean up"""
+        delay = min(SCHEDULER_MAX_SLEEP, (self._next_standup_time(now) - now).total_seconds())
+        
+        # Only the heads of the heaps matter; stale entries at worst cause an early wake
+        if self._pending_join_heap:
+            delay = min(delay, (self._pending_join_heap[0][0] - now).total_seconds())
+        if self._cleanup_heap:
+            cleanup_at = self._cleanup_heap[0][0] + SESSION_CLEANUP_AGE
+            delay = min(delay, (cleanup_at - now).total_seconds())
+        
+        return max(delay, 0)
+    
+    async def _check_pending_joins(self):
         """Check for sessions that need bot joining with fault tolerance"""
-        now = datetime.now()
+        now = self._tick_now
+        pending = []
         
-        for session_id, session in list(self._active_sessions.items()):
-            # Process sessions that should be joined (at or after start time, within 10 minutes)
-            if (session.status == MeetingStatus.CREATED and 
-                session.start_time <= now and
-                (now - session.start_time).total_seconds() < 600):  # Extended to 10 minutes
-                
-                # Check if bot is already active in meeting
-                if self._verify_bot_active(session):
-                    session.status = MeetingStatus.IN_PROGRESS
-                    self._save_sessions()
-                    self.logger.info(f"Bot verified active in meeting: {session_id}")
-                    continue
-                
-                # Join immediately when it's time - don't wait for users
-                self.logger.info(f"Meeting start time reached, joining immediately: {session_id}")
-                self.logger.info(f"Meeting URL: {session.google_meet_url}")
-                
-                try:
-                    # Use async join with proper session management
-                    asyncio.create_task(self._join_with_retry(session))
-                        
-                except Exception as e:
-                    self.logger.error(f"Failed to schedule join for meeting {session_id}: {e}")
+        # Pop only the sessions whose start time or recheck time has been reached
+        while self._pending_join_heap and self._pending_join_heap[0][0] <= now:
+            _, session_id = heapq.heappop(self._pending_join_heap)
+            session = self._active_sessions.get(session_id)
             
-            # Clean up old sessions (older than 2 hours)
-            elif (session.start_time < now - timedelta(hours=2)):
+            # Process sessions that should be joined (at or after start time, within 10 minutes)
+            if (session and session.status == MeetingStatus.CREATED and
+                (now - session.start_time).total_seconds() < JOIN_WINDOW):
+                pending.append(session)
+        
+        # Clean up old sessions (older than 2 hours)
+        cleanup_before = now - SESSION_CLEANUP_AGE
+        while self._cleanup_heap and self._cleanup_heap[0][0] < cleanup_before:
+            _, session_id = heapq.heappop(self._cleanup_heap)
+            session = self._active_sessions.get(session_id)
+            if session:
                 self.logger.info(f"Cleaning up old session: {session_id}")
                 if session.bot_session_id:
                     try:
@@ -855,220 +1453,304 @@ class AthenaMeetBot:
                     except Exception as e:
                         self.logger.debug(f"Error cleaning up bot: {e}")
                 del self._active_sessions[session_id]
-                self._save_sessions()
-    
-    def _join_meeting_sync(self, session: MeetingSession):
-        """Synchronous meeting join with retry logic"""
-        max_retries = 3
-        for attempt in range(max_retries):
+                self._verify_cache.pop(session_id, None)
+                self._unindex_session(session)
+                self._dirty.add(session_id)
+        
+        # Check whether bots are already active for all due sessions at once
+        active = await asyncio.gather(*(self._verify_bot_active(session) for session in pending))
+        
+        for session, is_active in zip(pending, active):
+            if is_active:
+                session.status = MeetingStatus.IN_PROGRESS
+                self._mark_dirty(session)
+                self.logger.info(f"Bot verified active in meeting: {session.meeting_id}")
+                continue
+            
+            # Join immediately when it's time - don't wait for users
+            self.logger.info(f"Meeting start time reached, joining immediately: {session.meeting_id}")
+            self.logger.info(f"Meeting URL: {session.google_meet_url}")
+            
             try:
-                # Delete any existing bot first
-                self._delete_bot_sync(session)
-                time.sleep(2)
-                
-                # Join with fresh bot
-                bot_data = self._create_bot_sync(session)
-                if bot_data and bot_data.get("status") == "active":
-                    session.bot_session_id = bot_data["id"]
-                    session.status = MeetingStatus.IN_PROGRESS
-                    self._save_sessions()
-                    self.logger.info(f"Successfully joined meeting: {session.meeting_id}")
-                    return
+                # Use async join with proper session management
+                asyncio.create_task(self._join_with_retry(session))
                     
             except Exception as e:
-                self.logger.warning(f"Join attempt {attempt + 1} failed: {e}")
-                time.sleep(5)
+                self.logger.error(f"Failed to schedule join for meeting {session.meeting_id}: {e}")
         
-        self.logger.error(f"Failed to join meeting after {max_retries} attempts: {session.meeting_id}")
+        # Recheck sessions inside their join window; any whose join got going are skipped then
+        recheck_at = now + JOIN_RECHECK_INTERVAL
+        for session in pending:
+            if (recheck_at - session.start_time).total_seconds() < JOIN_WINDOW:
+                heapq.heappush(self._pending_join_heap, (recheck_at, session.meeting_id))
+        
+        self._save_sessions()
+    
+    async def _fetch_bot_endpoint(self, template: str, session: MeetingSession) -> Optional[Any]:
+        """GET one bot status endpoint, returning the parsed body or None on failure"""
+        try:
+            async with self._get_http().get(
+                self._session_urls(session)[template],
+                headers=self._vexa_headers,
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                if response.status != 200:
+                    return None
+                return await response.json(content_type=None, loads=orjson.loads)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
     
-    def _create_bot_sync(self, session: MeetingSession) -> dict:
-        """Create bot synchronously"""
-        api_key = self.config["vexa"]["api_key"]
-        webhook_url = self.config["webhook"]["url"]
+    def _record_active_bot(self, session: MeetingSession, data: Any) -> bool:
+        """Record the session's bot from a status response if it is active"""
+        # Handle different response formats, indexing bot lists once by meeting id
+        bots = data if isinstance(data, list) else [data]
+        by_meeting = {}
+        for bot_data in bots:
+            by_meeting.setdefault(bot_data.get("native_meeting_id"), bot_data)
+            by_meeting.setdefault(bot_data.get("meeting_id"), bot_data)
         
-        payload = {
-            "platform": "google_meet",
-            "meeting_url": session.google_meet_url,
-            "native_meeting_id": session.google_meet_id,
-            "webhook_url": webhook_url,
-            "name": self.config["bot"]["name"],
-            "wait_for_host": False,
-            "auto_leave_on_empty": True
-        }
+        bot_data = by_meeting.get(session.google_meet_id)
+        if bot_data and bot_data.get("status") in BOT_ACTIVE_STATUSES:
+            session.bot_session_id = bot_data.get("id", bot_data.get("bot_id"))
+            self._mark_dirty(session)
+            self.logger.debug("Found active bot: %s", session.bot_session_id)
+            return True
+        return False
+    
+    async def _verify_bot_active(self, session: MeetingSession) -> bool:
+        """Verify if bot is actually active in meeting, sharing in-flight and very recent checks"""
+        key = session.meeting_id
+        cached = self._verify_cache.get(key)
+        if cached and time.monotonic() - cached[0] < VERIFY_CACHE_TTL:
+            return cached[1]
         
-        response = requests.post(
-            f"{self.config['vexa']['base_url']}/bots",
-            headers={'X-API-Key': api_key, 'Content-Type': 'application/json'},
-            json=payload,
-            timeout=30
-        )
+        # Concurrent callers for the same session wait on a single request
+        inflight = self._verify_inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._check_bot_active(session))
+            self._verify_inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._verify_inflight.pop(key, None))
         
-        if response.status_code in [200, 201]:  # Both 200 and 201 are success
-            return response.json()
-        else:
-            raise Exception(f"API error: {response.status_code} - {response.text}")
+        # Shielded so one cancelled caller does not cancel the check for the others
+        result = await asyncio.shield(inflight)
+        self._verify_cache[key] = (time.monotonic(), result)
+        return result
     
-    def _delete_bot_sync(self, session: MeetingSession):
-        """Delete bot synchronously"""
+    async def _check_bot_active(self, session: MeetingSession) -> bool:
+        """Ask Vexa whether the session's bot is active in the meeting"""
         try:
-            api_key = self.config["vexa"]["api_key"]
-            response = requests.delete(
-                f"{self.config['vexa']['base_url']}/bots/google_meet/{session.google_meet_id}",
-                headers={'X-API-Key': api_key},
-                timeout=10
+            # Try the endpoint that answered last time first
+            templates = list(BOT_STATUS_ENDPOINTS)
+            if self._vexa_bot_endpoint:
+                data = await self._fetch_bot_endpoint(self._vexa_bot_endpoint, session)
+                if data is not None:
+                    return self._record_active_bot(session, data)
+                templates.remove(self._vexa_bot_endpoint)
+            
+            # Probe the remaining per-bot endpoints concurrently; the most specific answer wins
+            results = await asyncio.gather(
+                *(self._fetch_bot_endpoint(template, session) for template in templates)
             )
-            if response.status_code in [200, 404]:  # 404 means already deleted
-                self.logger.info(f"Bot deleted from meeting {session.meeting_id}")
-        except Exception as e:
-            self.logger.warning(f"Failed to delete bot: {e}")
-    
-    def _verify_bot_active(self, session: MeetingSession) -> bool:
-        """Verify if bot is actually active in meeting"""
-        try:
-            api_key = self.config["vexa"]["api_key"]
-            headers = {'X-API-Key': api_key}
+            for template, data in zip(templates, results):
+                if data is not None:
+                    self._vexa_bot_endpoint = template
+                    return self._record_active_bot(session, data)
             
-            # Check bot status via API - try different endpoints
-            endpoints = [
-                f"/bots/google_meet/{session.google_meet_id}",
-                f"/bots/{session.google_meet_id}",
-                "/bots"
-            ]
-            
-            for endpoint in endpoints:
-                try:
-                    response = requests.get(
-                        f"{self.config['vexa']['base_url']}{endpoint}",
-                        headers=headers,
-                        timeout=5
-                    )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        
-                        # Handle different response formats
-                        bots = data if isinstance(data, list) else [data]
-                        
-                        for bot_data in bots:
-                            # Check if this bot matches our meeting
-                            if (bot_data.get("native_meeting_id") == session.google_meet_id or
-                                bot_data.get("meeting_id") == session.google_meet_id):
-                                
-                                if bot_data.get("status") in ["active", "in_meeting", "connected"]:
-                                    session.bot_session_id = bot_data.get("id", bot_data.get("bot_id"))
-                                    self.logger.debug(f"Found active bot: {session.bot_session_id}")
-                                    return True
-                        
-                        # If we got a successful response from /bots endpoint, we found all bots
-                        if endpoint == "/bots":
-                            break
-                            
-                except requests.RequestException:
-                    continue
+            # Only download the full bot list when no per-bot endpoint answered; the list
+            # answers even before a bot exists, so it is never remembered
+            data = await self._fetch_bot_endpoint(BOT_LIST_ENDPOINT, session)
+            if data is not None:
+                return self._record_active_bot(session, data)
             
         except Exception as e:
-            self.logger.debug(f"Bot verification failed: {e}")
+            self.logger.debug("Bot verification failed: %s", e)
         
         return False
     
+    async def start_status_receiver(self):
+        """Serve Vexa bot status webhooks on the configured port, if any"""
+        if not self._status_port or self._status_runner is not None:
+            return
+        from aiohttp import web
+        
+        app = web.Application()
+        app.router.add_post(STATUS_WEBHOOK_PATH, self._receive_bot_status)
+        self._status_runner = web.AppRunner(app, access_log=None)
+        await self._status_runner.setup()
+        await web.TCPSite(self._status_runner, port=int(self._status_port)).start()
+        self.logger.info("Listening for bot status webhooks on port %s", self._status_port)
+    
+    async def _receive_bot_status(self, request: "aiohttp.web.Request") -> "aiohttp.web.Response":
+        """Pass a Vexa status webhook to handle_bot_status"""
+        from aiohttp import web
+        
+        try:
+            data = await request.json(loads=orjson.loads)
+            native_meeting_id, status = data["native_meeting_id"], data["status"]
+        except (ValueError, KeyError, TypeError):
+            return web.json_response({"error": "native_meeting_id and status required"}, status=400)
+        
+        # Handlers run on the bot's loop; other threads must go through notify_bot_status
+        self.handle_bot_status(native_meeting_id, status)
+        return web.json_response({"status": "accepted"}, status=202)
+    
+    def notify_bot_status(self, loop: asyncio.AbstractEventLoop, native_meeting_id: str, status: str):
+        """Hand a bot status change from another thread to handle_bot_status on the bot's loop"""
+        loop.call_soon_threadsafe(self.handle_bot_status, native_meeting_id, status)
+    
+    def handle_bot_status(self, native_meeting_id: str, status: str):
+        """Record a bot status change pushed by Vexa and wake the admission monitor
+        
+        Must be called on the event loop thread; use loop.call_soon_threadsafe otherwise.
+        """
+        for session in self._active_sessions.values():
+            if session.google_meet_id == native_meeting_id:
+                session.bot_status = status
+                if session.admission_event is not None:
+                    session.admission_event.set()
+                if session.joined_event is not None and status.lower() in BOT_ACTIVE_STATUSES:
+                    session.joined_event.set()
+    
+    async def _fetch_bot_status(self, session: MeetingSession) -> Optional[str]:
+        """Ask Vexa for the current status of the session's bot"""
+        try:
+            async with self._get_http().get(
+                f"{self._bots_url}/{session.bot_session_id}",
+                headers=self._vexa_headers,
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                if response.status != 200:
+                    return None
+                bot_data = await response.json(content_type=None, loads=orjson.loads)
+                return bot_data.get("status")
+        except Exception as e:
+            self.logger.debug("Bot status check failed: %s", e)
+            return None
+    
     async def _monitor_bot_admission(self, session: MeetingSession):
-        """Continuously monitor bot admission status and handle reconnection"""
-        start_time = datetime.now()
-        check_interval = 5  # Check every 5 seconds
-        max_monitoring_time = 600  # Monitor for up to 10 minutes
+        """Wait for bot status changes and handle admission or reconnection"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + ADMISSION_MONITOR_TIMEOUT
         reconnect_attempts = 0
         max_reconnect_attempts = 5
         
-        self.logger.info(f"🔄 Starting persistent admission monitoring...")
+        # Created here so the event belongs to the running loop
+        session.admission_event = asyncio.Event()
+        session.bot_status = None
+        
+        # Without a status receiver nothing is pushed, so check with Vexa more often
+        check_interval = (ADMISSION_LIVENESS_INTERVAL if self._status_runner is not None
+                          else ADMISSION_POLL_INTERVAL)
         
-        while (datetime.now() - start_time).total_seconds() < max_monitoring_time:
+        self.logger.info("🔄 Starting admission monitoring...")
+        
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            
             try:
-                # Check if bot is active
-                if self._verify_bot_active(session):
-                    session.status = MeetingStatus.IN_PROGRESS
-                    self.logger.info(f"✅ Bot successfully admitted and active!")
-                    
-                    # Start transcript monitoring
-                    asyncio.create_task(self._monitor_transcript(session))
-                    return
-                
-                # Check detailed bot status
-                api_key = self.config["vexa"]["api_key"]
-                headers = {'X-API-Key': api_key}
+                try:
+                    # Status pushes wake us immediately; otherwise check in with Vexa occasionally
+                    await asyncio.wait_for(
+                        session.admission_event.wait(),
+                        timeout=min(check_interval, remaining)
+                    )
+                    status = session.bot_status
+                except asyncio.TimeoutError:
+                    status = await self._fetch_bot_status(session)
+                session.admission_event.clear()
                 
-                response = requests.get(
-                    f"{self.config['vexa']['base_url']}/bots/{session.bot_session_id}",
-                    headers=headers,
-                    timeout=5
-                )
+                if not status:
+                    continue
+                status = status.lower()
                 
-                if response.status_code == 200:
-                    bot_data = response.json()
-                    status = bot_data.get("status", "").lower()
+                if status in BOT_ACTIVE_STATUSES or status == "admitted":
+                    session.status = MeetingStatus.IN_PROGRESS
+                    self._mark_dirty(session)
+                    if session.joined_event is not None:
+                        session.joined_event.set()
+                    self.logger.info("✅ Bot admitted with status: %s", status)
+                    self._monitor_transcript(session)
+                    return
+                elif status in ["waiting_for_admission", "pending", "waiting"]:
+                    elapsed = int(ADMISSION_MONITOR_TIMEOUT - (deadline - loop.time()))
+                    self.logger.info("⏳ Bot waiting for admission... (%ss elapsed)", elapsed)
+                elif status in ["failed", "error", "disconnected", "left"]:
+                    self.logger.warning("⚠️ Bot disconnected with status: %s", status)
                     
-                    if status in ["active", "in_meeting", "connected", "admitted"]:
-                        session.status = MeetingStatus.IN_PROGRESS
-                        self.logger.info(f"✅ Bot admitted with status: {status}")
-                        asyncio.create_task(self._monitor_transcript(session))
-                        return
-                    elif status in ["waiting_for_admission", "pending", "waiting"]:
-                        elapsed = int((datetime.now() - start_time).total_seconds())
-                        self.logger.info(f"⏳ Bot waiting for admission... ({elapsed}s elapsed)")
-                    elif status in ["failed", "error", "disconnected", "left"]:
-                        self.logger.warning(f"⚠️ Bot disconnected with status: {status}")
+                    # Try to reconnect if we haven't exceeded max attempts
+                    if reconnect_attempts < max_reconnect_attempts:
+                        reconnect_attempts += 1
+                        self.logger.info("🔄 Attempting reconnection %s/%s", reconnect_attempts, max_reconnect_attempts)
+                        
+                        # Delete old bot and create new one
+                        await self._delete_bot(session)
+                        await asyncio.sleep(3)
                         
-                        # Try to reconnect if we haven't exceeded max attempts
-                        if reconnect_attempts < max_reconnect_attempts:
-                            reconnect_attempts += 1
-                            self.logger.info(f"🔄 Attempting reconnection {reconnect_attempts}/{max_reconnect_attempts}")
-                            
-                            # Delete old bot and create new one
-                            await self._delete_bot(session)
-                            await asyncio.sleep(3)
-                            
-                            # Recreate the bot
-                            success = await self.join_meeting_with_athena(session)
-                            if success:
-                                return  # New monitoring will start
-                        else:
-                            self.logger.error(f"❌ Max reconnection attempts exceeded")
-                            session.status = MeetingStatus.FAILED
-                            return
+                        # Recreate the bot
+                        success = await self.join_meeting_with_athena(session)
+                        if success:
+                            return  # New monitoring will start
+                    else:
+                        self.logger.error("❌ Max reconnection attempts exceeded")
+                        session.status = MeetingStatus.FAILED
+                        self._mark_dirty(session)
+                        return
                 
             except Exception as e:
-                self.logger.debug(f"Error in admission monitoring: {e}")
-            
-            await asyncio.sleep(check_interval)
+                self.logger.debug("Error in admission monitoring: %s", e)
         
-        self.logger.warning(f"⏰ Bot admission monitoring timeout after {max_monitoring_time}s")
+        self.logger.warning("⏰ Bot admission monitoring timeout after %ss", ADMISSION_MONITOR_TIMEOUT)
         session.status = MeetingStatus.FAILED
+        self._mark_dirty(session)
+    
+    async def _await_bot_joined(self, session: MeetingSession) -> bool:
+        """Wait for the session's bot to become active, checking with Vexa between pushes"""
+        if session.status == MeetingStatus.IN_PROGRESS:
+            return True
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + JOIN_CONFIRM_TIMEOUT
+        # A running status receiver usually pushes first; otherwise check every second
+        interval = JOIN_CONFIRM_TIMEOUT if self._status_runner is not None else JOIN_VERIFY_INTERVAL
+        
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            try:
+                await asyncio.wait_for(session.joined_event.wait(), timeout=min(interval, remaining))
+                return True
+            except asyncio.TimeoutError:
+                if await self._verify_bot_active(session):
+                    return True
     
     async def _join_with_retry(self, session: MeetingSession, max_retries: int = 5):
         """Join meeting with retry logic and fault tolerance"""
         for attempt in range(max_retries):
             try:
                 # If bot appears to be in meeting, verify it's actually active
-                if self._verify_bot_active(session):
+                if await self._verify_bot_active(session):
                     self.logger.info(f"Bot already active in meeting {session.meeting_id}")
                     session.status = MeetingStatus.IN_PROGRESS
-                    self._save_sessions()
+                    self._mark_dirty(session)
                     return True
                 
                 # If previous bot exists but not active, delete it first
                 if session.bot_session_id:
                     await self._delete_bot(session)
                     session.bot_session_id = None
+                    self._mark_dirty(session)
                 
                 # Attempt to join
+                session.joined_event = asyncio.Event()
                 success = await self.join_meeting_with_athena(session)
                 
                 if success:
-                    # Double-check bot is active within 10 seconds
-                    for check in range(10):
-                        await asyncio.sleep(1)
-                        if self._verify_bot_active(session):
-                            self.logger.info(f"Bot successfully active in meeting {session.meeting_id}")
-                            return True
+                    if await self._await_bot_joined(session):
+                        self.logger.info(f"Bot successfully active in meeting {session.meeting_id}")
+                        return True
                     
                     self.logger.warning(f"Bot joined but not verified as active: {session.meeting_id}")
                 else:
@@ -1086,17 +1768,13 @@ class AthenaMeetBot:
     async def _delete_bot(self, session: MeetingSession):
         """Delete existing bot from meeting"""
         try:
-            api_key = self.config["vexa"]["api_key"]
-            headers = {'X-API-Key': api_key}
-            
-            response = requests.delete(
-                f"{self.config['vexa']['base_url']}/bots/google_meet/{session.google_meet_id}",
-                headers=headers,
-                timeout=10
-            )
-            
-            if response.status_code in [200, 202, 404]:  # 404 means already deleted
-                self.logger.info(f"Previous bot deleted from meeting {session.meeting_id}")
+            async with self._get_http().delete(
+                self._session_urls(session)['delete'],
+                headers=self._vexa_headers,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status in [200, 202, 404]:  # 404 means already deleted
+                    self.logger.info(f"Previous bot deleted from meeting {session.meeting_id}")
             
         except Exception as e:
             self.logger.debug(f"Bot deletion failed (may not exist): {e}")
@@ -1115,81 +1793,96 @@ async def main():
     
     args = parser.parse_args()
     
+    # Run new tasks eagerly up to their first await (Python 3.12+)
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    
     # Initialize bot
     bot = AthenaMeetBot(args.config)
     
-    if args.mode == 'scheduler':
-        # Run scheduled mode
-        bot.schedule_daily_standups()
-        bot.run_scheduler()
-    
-    elif args.mode == 'create':
-        # Create a test meeting and schedule bot to join at start time
-        session = await bot.create_daily_standup()
-        if session:
-            print(f"Created meeting: {session.google_meet_url}")
-            print(f"Bot will join at: {session.start_time}")
-            # Schedule bot to join at meeting start time
-            asyncio.create_task(bot._schedule_bot_join(session))
-            # Keep running to wait for the scheduled join
-            await asyncio.sleep(3600)  # Wait up to 1 hour
-    
-    elif args.mode == 'bulk':
-        # Create meetings for next 7 days
-        print("🚀 Creating meetings for next 7 days...")
-        await bot.create_bulk_meetings(7)
-    
-    elif args.mode == 'delete-all':
-        # Delete all standup meetings
-        print("⚠️  This will delete ALL standup meetings from your calendar!")
-        confirm = input("Are you sure? (yes/no): ")
-        if confirm.lower() == 'yes':
-            await bot.delete_all_standup_meetings()
-        else:
-            print("❌ Cancelled")
-    
-    elif args.mode == 'test':
-        # Test mode with existing meeting URL
-        if not args.meeting_url:
-            print("--meeting-url required for test mode")
-            return
+    try:
+        # Modes that send a bot listen for its status changes
+        if args.mode in ('scheduler', 'create', 'test'):
+            await bot.start_status_receiver()
         
-        meet_id = args.meeting_url.split('/')[-1]
-        session = MeetingSession(
-            meeting_id=str(uuid.uuid4()),
-            google_meet_url=args.meeting_url,
-            google_meet_id=meet_id,
-            start_time=datetime.now(),
-            end_time=None,
-            status=MeetingStatus.CREATED
-        )
+        if args.mode == 'scheduler':
+            # Run scheduled mode
+            bot.schedule_daily_standups()
+            await bot.run_scheduler()
         
-        await bot.join_meeting_with_athena(session)
-    
-    elif args.mode == 'status':
-        # Show active sessions and their status
-        print("📊 ACTIVE SESSIONS:")
-        print("=" * 50)
+        elif args.mode == 'create':
+            # Create a test meeting and schedule bot to join at start time
+            session = await bot.create_daily_standup()
+            if session:
+                print(f"Created meeting: {session.google_meet_url}")
+                print(f"Bot will join at: {session.start_time}")
+                # Schedule bot to join at meeting start time
+                bot._queue_bot_join(session)
+                # Keep running to wait for the scheduled join
+                await asyncio.sleep(3600)  # Wait up to 1 hour
         
-        if not bot._active_sessions:
-            print("No active sessions found")
-        else:
-            for session_id, session in bot._active_sessions.items():
-                print(f"Session ID: {session_id}")
-                print(f"Meeting URL: {session.google_meet_url}")
-                print(f"Start Time: {session.start_time}")
-                print(f"Status: {session.status.value}")
-                print(f"Bot Joined: {'Yes' if session.bot_session_id else 'No'}")
-                
-                # Check if it's time to join
-                if session.start_time <= datetime.now() and not session.bot_session_id:
-                    print("🚨 READY TO JOIN!")
-                    answer = input("Join now? (y/n): ")
-                    if answer.lower() == 'y':
-                        await bot.join_meeting_with_athena(session)
-                
-                print("-" * 30)
+        elif args.mode == 'bulk':
+            # Create meetings for next 7 days
+            print("🚀 Creating meetings for next 7 days...")
+            await bot.create_bulk_meetings(7)
+        
+        elif args.mode == 'delete-all':
+            # Delete all standup meetings
+            print("⚠️  This will delete ALL standup meetings from your calendar!")
+            confirm = input("Are you sure? (yes/no): ")
+            if confirm.lower() == 'yes':
+                await bot.delete_all_standup_meetings()
+            else:
+                print("❌ Cancelled")
+        
+        elif args.mode == 'test':
+            # Test mode with existing meeting URL
+            if not args.meeting_url:
+                print("--meeting-url required for test mode")
+                return
+            
+            meet_id = args.meeting_url.split('/')[-1]
+            session = MeetingSession(
+                meeting_id=bot._new_id(),
+                google_meet_url=args.meeting_url,
+                google_meet_id=meet_id,
+                start_time=datetime.now(),
+                end_time=None,
+                status=MeetingStatus.CREATED
+            )
+            
+            await bot.join_meeting_with_athena(session)
+        
+        elif args.mode == 'status':
+            # Show active sessions and their status
+            print("📊 ACTIVE SESSIONS:")
+            print("=" * 50)
+            
+            if not bot._active_sessions:
+                print("No active sessions found")
+            else:
+                for session_id, session in bot._active_sessions.items():
+                    print(f"Session ID: {session_id}")
+                    print(f"Meeting URL: {session.google_meet_url}")
+                    print(f"Start Time: {session.start_time}")
+                    print(f"Status: {session.status.value}")
+                    print(f"Bot Joined: {'Yes' if session.bot_session_id else 'No'}")
+                    
+                    # Check if it's time to join
+                    if session.start_time <= datetime.now() and not session.bot_session_id:
+                        print("🚨 READY TO JOIN!")
+                        answer = input("Join now? (y/n): ")
+                        if answer.lower() == 'y':
+                            await bot.join_meeting_with_athena(session)
+                    
+                    print("-" * 30)
+    
+    finally:
+        await bot.close()
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
\ No newline at end of file
@@ -6,232 +6,606 @@ Handles SQLite database operations for storing standup records.
 
 import sqlite3
 import logging
+import queue
+import threading
+import zlib
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from pathlib import Path
 
+try:
+    import zstandard
+except ImportError:  # raw transcripts fall back to zlib compression
+    zstandard = None
+
 logger = logging.getLogger(__name__)
 
+# Per-connection tuning; journal_mode=WAL is persistent and set once in init_database
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+# Stored in PRAGMA user_version once the schema has been created
+SCHEMA_VERSION = 3
+
+# Large, rarely read columns kept out of the standups table in standups_blobs
+BLOB_COLUMNS = ("transcript_path", "teams_context", "previous_summaries", "raw_transcript")
+
+# Columns of the standups table that update_standup may change
+UPDATABLE_COLUMNS = ("date", "description", "trigger_event", "slack_posted")
+
+# Frame header that tells zstd-compressed transcripts apart from zlib ones
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Read-only connections kept open alongside the single writer
+READER_POOL_SIZE = 4
+
+# Listing rows read per query; the reader goes back to the pool between batches
+ITER_BATCH_SIZE = 100
+
+# Paths SQLite treats as a private in-memory or temporary database rather than a file
+IN_MEMORY_PATHS = (":memory:", "")
+
+# Connections are handed between threads but only ever used by one thread at a time,
+# which SQLite allows in multi-thread (threadsafety 1) and serialized (3) builds
+SHARE_CONNECTIONS = sqlite3.threadsafety >= 1
+
+
+def _compress_transcript(text: Optional[str]) -> Optional[bytes]:
+    """Compress a raw transcript for storage, with zstd when it is installed."""
+    if text is None:
+        return None
+    data = text.encode("utf-8")
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data)
+
+
+def _decompress_transcript(value) -> Optional[str]:
+    """Decompress a stored raw transcript; text stored before compression passes through."""
+    if value is None or isinstance(value, str):
+        return value
+    if value[:4] == ZSTD_MAGIC:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read this transcript")
+        return zstandard.ZstdDecompressor().decompress(value).decode("utf-8")
+    return zlib.decompress(value).decode("utf-8")
+
+
+def _encode_blob(column: str, value):
+    """Prepare a standups_blobs value for writing."""
+    return _compress_transcript(value) if column == "raw_transcript" else value
+
 
 class StandupDatabase:
-    def __init__(self, db_path: str = "standup.db"):
-        """Initialize database connection and create tables if needed."""
+    # Query text is fixed at class creation so each call hits the connection's statement cache
+    _SQL_INSERT = """
+        INSERT INTO standups (
+            date, description, trigger_event, slack_posted
+        ) VALUES (?, ?, ?, ?)
+        RETURNING id
+    """
+    _SQL_INSERT_BLOBS = """
+        INSERT INTO standups_blobs (
+            standup_id, transcript_path, teams_context,
+            previous_summaries, raw_transcript
+        ) VALUES (?, ?, ?, ?, ?)
+    """
+    _SQL_SELECT = "SELECT s.* FROM standups s"
+    _SQL_SELECT_WITH_BLOBS = (
+        "SELECT s.*, " + ", ".join(f"b.{column}" for column in BLOB_COLUMNS) +
+        " FROM standups s LEFT JOIN standups_blobs b ON b.standup_id = s.id"
+    )
+    _WHERE_DATE = """
+        WHERE s.date = ? 
+        ORDER BY s.created_at DESC 
+        LIMIT 1
+    """
+    _WHERE_ID = """
+        WHERE s.id = ? 
+        LIMIT 1
+    """
+    _SQL_BY_DATE = _SQL_SELECT + _WHERE_DATE
+    _SQL_BY_DATE_WITH_BLOBS = _SQL_SELECT_WITH_BLOBS + _WHERE_DATE
+    _SQL_BY_ID = _SQL_SELECT + _WHERE_ID
+    _SQL_BY_ID_WITH_BLOBS = _SQL_SELECT_WITH_BLOBS + _WHERE_ID
+    _SQL_RECENT = """
+        SELECT * FROM standups 
+        WHERE date >= date('now', ?)
+        ORDER BY date DESC
+    """
+    _SQL_ALL = """
+        SELECT * FROM standups 
+        ORDER BY date DESC 
+        LIMIT ?
+    """
+    # One batch of the listing, resuming after (last_date, last_id) in idx_standups_list order
+    _SQL_LIST_BATCH = """
+        SELECT id, date, trigger_event, slack_posted, created_at,
+               substr(description, 1, 100) AS description_preview
+        FROM standups 
+        WHERE date >= COALESCE(date('now', :since), '')
+          AND (:last_date IS NULL OR date < :last_date OR (date = :last_date AND id > :last_id))
+        ORDER BY date DESC, id 
+        LIMIT :batch
+    """
+    # Each column is bound as a (changed, value) pair, so one statement covers any subset of
+    # fields and a field can still be set to NULL
+    _SQL_UPDATE = (
+        "UPDATE standups SET " +
+        "".join(f"{column} = CASE WHEN ? THEN ? ELSE {column} END, " for column in UPDATABLE_COLUMNS) +
+        "updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+    )
+    _SQL_UPSERT_BLOBS = (
+        "INSERT INTO standups_blobs (standup_id, " + ", ".join(BLOB_COLUMNS) + ") " +
+        "VALUES (?" + ", ?" * len(BLOB_COLUMNS) + ") ON CONFLICT(standup_id) DO UPDATE SET " +
+        ", ".join(f"{column} = CASE WHEN ? THEN excluded.{column} ELSE {column} END" for column in BLOB_COLUMNS)
+    )
+    _SQL_UNPOSTED = """
+        SELECT * FROM standups 
+        WHERE slack_posted = 0
+        ORDER BY date
+    """
+    _SQL_DELETE_BLOBS = "DELETE FROM standups_blobs WHERE standup_id = ?"
+    _SQL_DELETE = "DELETE FROM standups WHERE id = ?"
+    _SQL_STATS = """
+        SELECT COUNT(*),
+               COUNT(CASE WHEN date >= date('now', ?) THEN 1 END),
+               COUNT(CASE WHEN slack_posted = TRUE THEN 1 END)
+        FROM standups
+    """
+    _SQL_TRIGGER_COUNTS = """
+        SELECT trigger_event, COUNT(*) 
+        FROM standups 
+        GROUP BY trigger_event
+    """
+    
+    def __init__(self, db_path: str = "standup.db", shared_cache: bool = False):
+        """Initialize database connection and create tables if needed.
+        
+        The writer is guarded by a lock and readers are checked out of a queue, so a
+        connection is never used by two threads at once. That is all SQLite's multi-thread
+        mode requires; a pysqlite3 build compiled with -DSQLITE_THREADSAFE=2 drops the
+        per-call mutex of the default serialized mode. Single-thread builds keep
+        check_same_thread on.
+        
+        With shared_cache the writer and readers share one page cache inside this process
+        instead of each holding its own. SQLite then takes table-level locks between them,
+        so readers can wait on an open write transaction; leave it off unless memory per
+        connection matters more than read concurrency.
+        
+        ":memory:" opens a named in-memory database with a shared cache, so the writer
+        and readers all see the same data; it lasts until close().
+        """
         self.db_path = db_path
+        in_memory = db_path in IN_MEMORY_PATHS
+        if in_memory:
+            memory_uri = f"file:standups-{id(self)}?mode=memory&cache=shared"
+            writer_uri = reader_uri = memory_uri
+        else:
+            db_uri = Path(self.db_path).resolve().as_uri()
+            cache = "&cache=shared" if shared_cache else ""
+            writer_uri = f"{db_uri}?mode=rwc{cache}"
+            reader_uri = f"{db_uri}?mode=ro{cache}"
+        
+        self._write_lock = threading.Lock()
+        self._writer = self._connect(writer_uri, uri=True)
         self.init_database()
+        
+        # WAL allows one writer but any number of readers, so reads get their own pool
+        self._reader_conns = [self._connect(reader_uri, uri=True) for _ in range(READER_POOL_SIZE)]
+        if in_memory:
+            # mode=ro cannot be combined with mode=memory
+            for conn in self._reader_conns:
+                conn.execute("PRAGMA query_only=ON")
+        self._readers = queue.Queue()
+        for conn in self._reader_conns:
+            self._readers.put(conn)
+    
+    def _connect(self, database: str, uri: bool = False) -> sqlite3.Connection:
+        """Open an autocommit connection with the tuning pragmas applied."""
+        conn = sqlite3.connect(database, uri=uri, check_same_thread=not SHARE_CONNECTIONS, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def _read(self):
+        """Borrow a read-only connection from the pool."""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    @contextmanager
+    def _write(self):
+        """Hold the writer connection exclusively."""
+        with self._write_lock:
+            yield self._writer
     
     def init_database(self):
         """Initialize the database and create tables."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._write() as conn:
                 cursor = conn.cursor()
                 
-                # Create standups table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS standups (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        date TEXT NOT NULL,
-                        description TEXT NOT NULL,
-                        trigger_event TEXT,
-                        transcript_path TEXT,
-                        teams_context TEXT,
-                        previous_summaries TEXT,
-                        raw_transcript TEXT,
-                        slack_posted BOOLEAN DEFAULT FALSE,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Create index on date for faster queries
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_standups_date 
-                    ON standups(date)
-                """)
-                
-                conn.commit()
-                logger.info(f"Database initialized at {self.db_path}")
+                # Schema already current, nothing to create
+                cursor.execute("PRAGMA user_version")
+                if cursor.fetchone()[0] == SCHEMA_VERSION:
+                    return
+                
+                # Only takes effect on a new, empty file; larger pages pack compressed blobs better
+                cursor.execute("PRAGMA page_size=8192")
+                
+                # WAL lets readers run alongside a writer and cuts fsyncs per commit
+                cursor.execute("PRAGMA journal_mode=WAL")
+                
+                cursor.execute("BEGIN EXCLUSIVE")
+                try:
+                    # Create standups table
+                    cursor.execute("""
+                        CREATE TABLE IF NOT EXISTS standups (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            date TEXT NOT NULL,
+                            description TEXT NOT NULL,
+                            trigger_event TEXT,
+                            slack_posted INTEGER NOT NULL DEFAULT 0,
+                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        )
+                    """)
+                    
+                    # Create table for the large columns, one row per standup that has any
+                    cursor.execute("""
+                        CREATE TABLE IF NOT EXISTS standups_blobs (
+                            standup_id INTEGER PRIMARY KEY REFERENCES standups(id),
+                            transcript_path TEXT,
+                            teams_context TEXT,
+                            previous_summaries TEXT,
+                            raw_transcript BLOB
+                        )
+                    """)
+                    
+                    # Databases from before the split still carry the large columns inline
+                    cursor.execute("PRAGMA table_info(standups)")
+                    if "raw_transcript" in {row["name"] for row in cursor.fetchall()}:
+                        self._move_blob_columns(cursor)
+                    
+                    # Older files declared slack_posted BOOLEAN; keep its values strictly 0 or 1
+                    cursor.execute("""
+                        UPDATE standups 
+                        SET slack_posted = CASE WHEN slack_posted IN (1, 'TRUE', 'true') THEN 1 ELSE 0 END
+                        WHERE slack_posted IS NULL OR slack_posted NOT IN (0, 1)
+                    """)
+                    
+                    # Create index on date for faster queries
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_standups_date 
+                        ON standups(date)
+                    """)
+                    
+                    # Index carrying the list view's columns so listing skips the wide rows
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_standups_list 
+                        ON standups(date DESC, id, trigger_event, slack_posted, created_at)
+                    """)
+                    
+                    # Lets the per-trigger stats GROUP BY read the index in order
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_standups_trigger 
+                        ON standups(trigger_event)
+                    """)
+                    
+                    # Small partial index covering only standups still waiting to be posted
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_standups_unposted 
+                        ON standups(date) WHERE slack_posted = 0
+                    """)
+                    
+                    cursor.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+                    cursor.execute("COMMIT")
+                except sqlite3.Error:
+                    cursor.execute("ROLLBACK")
+                    raise
+                
+                logger.info("Database initialized at %s", self.db_path)
                 
         except sqlite3.Error as e:
-            logger.error(f"Error initializing database: {e}")
+            logger.error("Error initializing database: %s", e)
             raise
     
+    def _move_blob_columns(self, cursor: sqlite3.Cursor):
+        """Copy the large columns of an old single-table schema into standups_blobs and drop them."""
+        columns = ", ".join(BLOB_COLUMNS)
+        cursor.execute(f"""
+            INSERT OR IGNORE INTO standups_blobs (standup_id, {columns})
+            SELECT id, {columns} FROM standups
+            WHERE COALESCE({columns}) IS NOT NULL
+        """)
+        for column in BLOB_COLUMNS:
+            cursor.execute(f"ALTER TABLE standups DROP COLUMN {column}")
+        logger.info("Moved large standup columns into standups_blobs")
+    
     def save_standup(self, date: str, description: str, 
                     trigger_event: str = None, transcript_path: str = None,
                     teams_context: str = None, previous_summaries: str = None,
                     raw_transcript: str = None, slack_posted: bool = False) -> int:
         """Save a standup record to the database."""
+        standup_id = self.save_standups_bulk([{
+            "date": date, "description": description,
+            "trigger_event": trigger_event, "transcript_path": transcript_path,
+            "teams_context": teams_context, "previous_summaries": previous_summaries,
+            "raw_transcript": raw_transcript, "slack_posted": slack_posted,
+        }])[0]
+        logger.info("Saved standup record with ID: %s", standup_id)
+        return standup_id
+    
+    def save_standups_bulk(self, records: List[Dict]) -> List[int]:
+        """Save several standup records in one transaction and return their IDs."""
+        if not records:
+            return []
+        
+        rows = [
+            (record.get("date"), record.get("description"),
+             record.get("trigger_event"), int(bool(record.get("slack_posted"))))
+            for record in records
+        ]
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._write() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("""
-                    INSERT INTO standups (
-                        date, description, trigger_event, transcript_path,
-                        teams_context, previous_summaries, raw_transcript,
-                        slack_posted
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    date, description, trigger_event, transcript_path,
-                    teams_context, previous_summaries, raw_transcript,
-                    slack_posted
-                ))
-                
-                standup_id = cursor.lastrowid
-                conn.commit()
+                cursor.execute("BEGIN")
+                try:
+                    # RETURNING ties each generated ID to its input row; one commit for all
+                    standup_ids = []
+                    for row in rows:
+                        cursor.execute(self._SQL_INSERT, row)
+                        standup_ids.append(cursor.fetchone()[0])
+                    
+                    blob_rows = [
+                        (standup_id, *(_encode_blob(column, record.get(column)) for column in BLOB_COLUMNS))
+                        for standup_id, record in zip(standup_ids, records)
+                        if any(record.get(column) is not None for column in BLOB_COLUMNS)
+                    ]
+                    if blob_rows:
+                        cursor.executemany(self._SQL_INSERT_BLOBS, blob_rows)
+                    
+                    cursor.execute("COMMIT")
+                except sqlite3.Error:
+                    cursor.execute("ROLLBACK")
+                    raise
                 
-                logger.info(f"Saved standup record with ID: {standup_id}")
-                return standup_id
+                if len(rows) > 1:
+                    logger.info("Saved %s standup records", len(rows))
+                return standup_ids
                 
         except sqlite3.Error as e:
-            logger.error(f"Error saving standup: {e}")
+            logger.error("Error saving standup: %s", e)
             raise
     
-    def get_standup_by_date(self, date: str) -> Optional[Dict]:
-        """Get standup record for a specific date."""
+    def get_standup_by_date(self, date: str, with_blobs: bool = False) -> Optional[Dict]:
+        """Get standup record for a specific date, joining the large columns if with_blobs."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._read() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("""
-                    SELECT * FROM standups 
-                    WHERE date = ? 
-                    ORDER BY created_at DESC 
-                    LIMIT 1
-                """, (date,))
+                sql = self._SQL_BY_DATE_WITH_BLOBS if with_blobs else self._SQL_BY_DATE
+                cursor.execute(sql, (date,))
                 
                 row = cursor.fetchone()
-                return dict(row) if row else None
+                if not row:
+                    return None
+                standup = dict(row)
+                if with_blobs:
+                    standup["raw_transcript"] = _decompress_transcript(standup["raw_transcript"])
+                return standup
                 
         except sqlite3.Error as e:
-            logger.error(f"Error getting standup by date: {e}")
+            logger.error("Error getting standup by date: %s", e)
+            return None
+    
+    def get_standup_by_id(self, standup_id: int, with_blobs: bool = False) -> Optional[Dict]:
+        """Get standup record by its ID, joining the large columns if with_blobs."""
+        try:
+            with self._read() as conn:
+                cursor = conn.cursor()
+                
+                sql = self._SQL_BY_ID_WITH_BLOBS if with_blobs else self._SQL_BY_ID
+                cursor.execute(sql, (standup_id,))
+                
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                standup = dict(row)
+                if with_blobs:
+                    standup["raw_transcript"] = _decompress_transcript(standup["raw_transcript"])
+                return standup
+                
+        except sqlite3.Error as e:
+            logger.error("Error getting standup by ID: %s", e)
             return None
     
     def get_recent_standups(self, days: int = 5) -> List[Dict]:
         """Get standup records from the last N days."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._read() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("""
-                    SELECT * FROM standups 
-                    WHERE date >= date('now', '-{} days')
-                    ORDER BY date DESC
-                """.format(days))
+                cursor.execute(self._SQL_RECENT, (f"-{int(days)} days",))
                 
                 rows = cursor.fetchall()
                 return [dict(row) for row in rows]
                 
         except sqlite3.Error as e:
-            logger.error(f"Error getting recent standups: {e}")
+            logger.error("Error getting recent standups: %s", e)
             return []
     
     def get_all_standups(self, limit: int = 100) -> List[Dict]:
         """Get all standup records with optional limit."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._read() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute(self._SQL_ALL, (limit,))
+                
+                rows = cursor.fetchall()
+                return [dict(row) for row in rows]
+                
+        except sqlite3.Error as e:
+            logger.error("Error getting all standups: %s", e)
+            return []
+    
+    def get_unposted_standups(self) -> List[Dict]:
+        """Get standup records not yet posted to Slack, oldest first."""
+        try:
+            with self._read() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("""
-                    SELECT * FROM standups 
-                    ORDER BY date DESC 
-                    LIMIT ?
-                """, (limit,))
+                cursor.execute(self._SQL_UNPOSTED)
                 
                 rows = cursor.fetchall()
                 return [dict(row) for row in rows]
                 
         except sqlite3.Error as e:
-            logger.error(f"Error getting all standups: {e}")
+            logger.error("Error getting unposted standups: %s", e)
             return []
     
+    def list_standups(self, limit: int = 100, days: Optional[int] = None) -> List[Dict]:
+        """Get the columns shown in listings, with a 100 character description preview.
+        
+        Limited to the last N days when days is given, otherwise to the latest limit records.
+        """
+        return list(self.iter_standups(limit, days))
+    
+    def iter_standups(self, limit: int = 100, days: Optional[int] = None) -> Iterator[Dict]:
+        """Yield the list_standups records, reading ITER_BATCH_SIZE rows per query.
+        
+        No reader is held between batches, so a partly consumed or abandoned iterator
+        never keeps a connection out of the pool.
+        """
+        remaining = None if days is not None else limit
+        params = {
+            "since": f"-{int(days)} days" if days is not None else None,
+            "last_date": None,
+            "last_id": None,
+        }
+        
+        while remaining is None or remaining > 0:
+            params["batch"] = ITER_BATCH_SIZE if remaining is None else min(ITER_BATCH_SIZE, remaining)
+            try:
+                with self._read() as conn:
+                    rows = conn.execute(self._SQL_LIST_BATCH, params).fetchall()
+            except sqlite3.Error as e:
+                logger.error("Error listing standups: %s", e)
+                return
+            
+            for row in rows:
+                yield dict(row)
+            
+            if len(rows) < params["batch"]:
+                return
+            if remaining is not None:
+                remaining -= len(rows)
+            params["last_date"], params["last_id"] = rows[-1]["date"], rows[-1]["id"]
+    
     def update_standup(self, standup_id: int, **kwargs) -> bool:
         """Update a standup record."""
         if not kwargs:
             return False
         
+        unknown = set(kwargs) - set(UPDATABLE_COLUMNS) - set(BLOB_COLUMNS)
+        if unknown:
+            raise ValueError(f"Cannot update standup columns: {', '.join(sorted(unknown))}")
+        
+        if "slack_posted" in kwargs:
+            kwargs["slack_posted"] = int(bool(kwargs["slack_posted"]))
+        
+        values = []
+        for column in UPDATABLE_COLUMNS:
+            values += (column in kwargs, kwargs.get(column))
+        values.append(standup_id)
+        
+        has_blobs = any(column in kwargs for column in BLOB_COLUMNS)
+        blob_values = [standup_id, *(_encode_blob(column, kwargs.get(column)) for column in BLOB_COLUMNS),
+                       *(column in kwargs for column in BLOB_COLUMNS)]
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._write() as conn:
                 cursor = conn.cursor()
                 
-                # Build dynamic UPDATE query
-                set_clause = ", ".join([f"{key} = ?" for key in kwargs.keys()])
-                values = list(kwargs.values())
-                values.append(standup_id)
+                cursor.execute("BEGIN")
+                try:
+                    cursor.execute(self._SQL_UPDATE, values)
+                    updated = cursor.rowcount > 0
+                    
+                    if updated and has_blobs:
+                        cursor.execute(self._SQL_UPSERT_BLOBS, blob_values)
+                    
+                    cursor.execute("COMMIT")
+                except sqlite3.Error:
+                    cursor.execute("ROLLBACK")
+                    raise
                 
-                cursor.execute(f"""
-                    UPDATE standups 
-                    SET {set_clause}, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, values)
-                
-                conn.commit()
-                
-                if cursor.rowcount > 0:
-                    logger.info(f"Updated standup record ID: {standup_id}")
+                if updated:
+                    logger.info("Updated standup record ID: %s", standup_id)
                     return True
                 else:
-                    logger.warning(f"No standup record found with ID: {standup_id}")
+                    logger.warning("No standup record found with ID: %s", standup_id)
                     return False
                 
         except sqlite3.Error as e:
-            logger.error(f"Error updating standup: {e}")
+            logger.error("Error updating standup: %s", e)
             return False
     
     def delete_standup(self, standup_id: int) -> bool:
         """Delete a standup record."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._write() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("DELETE FROM standups WHERE id = ?", (standup_id,))
-                conn.commit()
+                cursor.execute("BEGIN")
+                try:
+                    cursor.execute(self._SQL_DELETE_BLOBS, (standup_id,))
+                    cursor.execute(self._SQL_DELETE, (standup_id,))
+                    deleted = cursor.rowcount > 0
+                    cursor.execute("COMMIT")
+                except sqlite3.Error:
+                    cursor.execute("ROLLBACK")
+                    raise
                 
-                if cursor.rowcount > 0:
-                    logger.info(f"Deleted standup record ID: {standup_id}")
+                if deleted:
+                    logger.info("Deleted standup record ID: %s", standup_id)
                     return True
                 else:
-                    logger.warning(f"No standup record found with ID: {standup_id}")
+                    logger.warning("No standup record found with ID: %s", standup_id)
                     return False
                 
         except sqlite3.Error as e:
-            logger.error(f"Error deleting standup: {e}")
+            logger.error("Error deleting standup: %s", e)
             return False
     
     def get_standup_stats(self) -> Dict:
         """Get basic statistics about standups."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
                 
-                # Total count
-                cursor.execute("SELECT COUNT(*) FROM standups")
-                total_count = cursor.fetchone()[0]
+                # Total, recent (last 30 days) and Slack posted counts in one scan
+                cursor.execute(self._SQL_STATS, ("-30 days",))
+                total_count, recent_count, slack_posted_count = cursor.fetchone()
                 
                 # Count by trigger event
-                cursor.execute("""
-                    SELECT trigger_event, COUNT(*) 
-                    FROM standups 
-                    GROUP BY trigger_event
-                """)
+                cursor.execute(self._SQL_TRIGGER_COUNTS)
                 trigger_counts = dict(cursor.fetchall())
                 
-                # Recent activity (last 30 days)
-                cursor.execute("""
-                    SELECT COUNT(*) FROM standups 
-                    WHERE date >= date('now', '-30 days')
-                """)
-                recent_count = cursor.fetchone()[0]
-                
-                # Slack posted count
-                cursor.execute("""
-                    SELECT COUNT(*) FROM standups 
-                    WHERE slack_posted = TRUE
-                """)
-                slack_posted_count = cursor.fetchone()[0]
-                
                 return {
                     "total_standups": total_count,
                     "recent_30_days": recent_count,
@@ -240,9 +614,12 @@ class StandupDatabase:
                 }
                 
         except sqlite3.Error as e:
-            logger.error(f"Error getting standup stats: {e}")
+            logger.error("Error getting standup stats: %s", e)
             return {}
     
     def close(self):
-        """Close database connection (not needed with context managers)."""
-        pass
\ No newline at end of file
+        """Close the writer and all reader connections, including any still checked out."""
+        with self._write_lock:
+            self._writer.close()
+        for conn in self._reader_conns:
+            conn.close()
\ No newline at end of file
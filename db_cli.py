@@ -6,9 +6,30 @@ Provides command-line interface for database operations.
 
 import argparse
 import json
+import queue
+import sys
+import threading
 from datetime import datetime
 from database import StandupDatabase
 
+_DONE = object()
+
+
+def _prefetch(iterable, maxsize=256):
+    """Iterate in a background thread so fetching overlaps with the caller's formatting."""
+    rows = queue.Queue(maxsize=maxsize)
+    
+    def produce():
+        try:
+            for item in iterable:
+                rows.put(item)
+        finally:
+            rows.put(_DONE)
+    
+    threading.Thread(target=produce, daemon=True).start()
+    while (item := rows.get()) is not _DONE:
+        yield item
+
 
 def main():
     parser = argparse.ArgumentParser(description='Standup Database CLI')
@@ -36,9 +57,11 @@ def main():
     
     # Add command
     add_parser = subparsers.add_parser('add', help='Add standup manually')
-    add_parser.add_argument('--date', required=True, help='Date (YYYY-MM-DD)')
-    add_parser.add_argument('--description', required=True, help='Standup description')
+    add_parser.add_argument('--date', help='Date (YYYY-MM-DD)')
+    add_parser.add_argument('--description', help='Standup description')
     add_parser.add_argument('--trigger', default='manual', help='Trigger event')
+    add_parser.add_argument('--bulk', metavar='FILE',
+                           help='JSON file with a list of standup records to add in one transaction')
     
     args = parser.parse_args()
     
@@ -60,29 +83,32 @@ def main():
     
     elif args.command == 'list':
         if args.recent:
-            standups = db.get_recent_standups(args.recent)
+            standups = db.iter_standups(days=args.recent)
             print(f"📅 Standups from last {args.recent} days:")
         else:
-            standups = db.get_all_standups(args.limit)
+            standups = db.iter_standups(args.limit)
             print(f"📋 Last {args.limit} standups:")
         
-        for standup in standups:
-            print(f"\n{standup['date']} (ID: {standup['id']})")
-            print(f"Trigger: {standup['trigger_event']}")
-            print(f"Description: {standup['description'][:100]}...")
-            print(f"Slack Posted: {'✅' if standup['slack_posted'] else '❌'}")
-            print(f"Created: {standup['created_at']}")
+        # One write for the whole listing instead of a print per line
+        lines = []
+        for standup in _prefetch(standups):
+            lines.append(
+                f"\n{standup['date']} (ID: {standup['id']})\n"
+                f"Trigger: {standup['trigger_event']}\n"
+                f"Description: {standup['description_preview']}...\n"
+                f"Slack Posted: {'✅' if standup['slack_posted'] else '❌'}\n"
+                f"Created: {standup['created_at']}\n"
+            )
+        sys.stdout.write("".join(lines))
     
     elif args.command == 'get':
-        # Try as date first, then as ID
+        # All digits is an ID, anything else must be a valid date
         try:
-            # Check if it's a date format
-            if '-' in args.identifier and len(args.identifier) == 10:
-                standup = db.get_standup_by_date(args.identifier)
+            if args.identifier.isdigit():
+                standup = db.get_standup_by_id(int(args.identifier))
             else:
-                # Assume it's an ID
-                standups = db.get_all_standups(1000)  # Get all to find by ID
-                standup = next((s for s in standups if s['id'] == int(args.identifier)), None)
+                datetime.strptime(args.identifier, '%Y-%m-%d')
+                standup = db.get_standup_by_date(args.identifier)
             
             if standup:
                 print(f"📄 Standup Details:")
@@ -108,15 +134,30 @@ def main():
             print(f"❌ Failed to delete standup ID: {args.id}")
     
     elif args.command == 'add':
-        try:
-            standup_id = db.save_standup(
-                date=args.date,
-                description=args.description,
-                trigger_event=args.trigger
-            )
-            print(f"✅ Added standup with ID: {standup_id}")
-        except Exception as e:
-            print(f"❌ Failed to add standup: {e}")
+        if args.bulk:
+            try:
+                with open(args.bulk) as f:
+                    records = json.load(f)
+                for record in records:
+                    record.setdefault('trigger_event', args.trigger)
+                standup_ids = db.save_standups_bulk(records)
+                print(f"✅ Added {len(standup_ids)} standups")
+            except Exception as e:
+                print(f"❌ Failed to add standups: {e}")
+        elif not args.date or not args.description:
+            add_parser.error('--date and --description are required without --bulk')
+        else:
+            try:
+                standup_id = db.save_standup(
+                    date=args.date,
+                    description=args.description,
+                    trigger_event=args.trigger
+                )
+                print(f"✅ Added standup with ID: {standup_id}")
+            except Exception as e:
+                print(f"❌ Failed to add standup: {e}")
+    
+    db.close()
 
 
 if __name__ == "__main__":
@@ -59,13 +59,13 @@ def initialize_jira() -> JiraIntegration:
 
 
 def generate_epic(prd_content: str, jira: JiraIntegration, 
-                 additional_context: str = "") -> None:
+                 additional_context: str = "", no_cache: bool = False) -> None:
     """Generate epic and display results"""
     try:
         print("🤖 Generating epic with AI...")
         
         generator = EpicGenerator(jira)
-        result = generator.generate_epic(prd_content, additional_context)
+        result = generator.generate_epic(prd_content, additional_context, no_cache=no_cache)
         
         print("✅ Epic generation completed!")
         print(f"📊 Generated {len(result.sprint_stories)} stories")
@@ -162,6 +162,12 @@ def main():
         default=""
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call the AI instead of reusing a cached response'
+    )
+    
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -186,7 +192,7 @@ def main():
     jira = initialize_jira()
     
     # Generate epic
-    generate_epic(prd_content, jira, args.context)
+    generate_epic(prd_content, jira, args.context, args.no_cache)
     
     print("\n🎉 Epic generation completed successfully!")
 
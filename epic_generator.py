@@ -4,24 +4,95 @@ Epic Generation Module for Athena AI Scrum Master
 Generates new sprint stories based on PRD, JIRA context, and completed work
 """
 
-import json
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+import math
+import re
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from functools import lru_cache
+from string import Template
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional
+from dataclasses import dataclass
 from datetime import datetime
 
-import openai
+import orjson
 from dotenv import load_dotenv
 import os
 
-from jira_integration import JiraIntegration
+# openai (and the httpx/pydantic stack behind it) and the JIRA client are imported
+# when a generator is created, so importing this module for its dataclasses stays cheap
+if TYPE_CHECKING:
+    from jira_integration import JiraIntegration
 
 load_dotenv()
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+# Semantic cache of AI responses, keyed by an embedding of the rendered user prompt
+EPIC_CACHE_DB = os.getenv("EPIC_CACHE_DB", "epic_cache.db")
+EPIC_CACHE_TTL = 86400  # seconds
+EPIC_CACHE_MAX_DISTANCE = 0.08  # cosine distance below which prompts count as the same
+EMBEDDING_MODEL = "text-embedding-3-small"
 
+# Concurrent epic generation
+AI_MAX_CONCURRENCY = 8  # in-flight chat requests, to stay under the RPM limit
+AI_MAX_RETRIES = 5
+AI_RETRY_BASE_DELAY = 1.0  # seconds, doubled on every rate-limited attempt
 
-@dataclass
+
+# Slotted dataclasses (3.10+) are smaller and faster to build; orjson serializes them the same way
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Context key for each summarized JIRA issue list, and where it comes from in the project context
+_ISSUE_SUMMARIES = (
+    ("backlog_summary", "backlog_issues"),
+    ("completed_work_summary", "completed_issues"),
+    ("incomplete_work_summary", "incomplete_sprint_issues"),
+)
+
+
+@lru_cache(maxsize=4)
+def _openai_client(api_key: str):
+    """Return the long-lived OpenAI client for an API key, so its connection pool is reused"""
+    import openai
+    return openai.OpenAI(api_key=api_key)
+
+
+_JSON_STRUCTURE = re.compile(r'\\.|["{}]', re.DOTALL)
+
+
+def _extract_json(text: str) -> str:
+    """Return the first balanced JSON object in text, skipping any surrounding markdown"""
+    start = text.find('{')
+    if start < 0:
+        return text
+    
+    # Only visit the characters that affect nesting; escapes are matched as pairs
+    depth = 0
+    in_string = False
+    for match in _JSON_STRUCTURE.finditer(text, start):
+        token = match.group()
+        if token[0] == '\\':
+            continue
+        if token == '"':
+            in_string = not in_string
+        elif in_string:
+            continue
+        elif token == '{':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return text[start:match.end()]
+    
+    # Unbalanced; let the parser report where it breaks
+    return text[start:]
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class SprintStory:
     """Represents a story for the next sprint"""
     title: str
@@ -35,7 +106,7 @@ class SprintStory:
     rationale: str = ""  # Why this story is important for next sprint
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class EpicGenerationResult:
     """Result of epic generation process"""
     sprint_stories: List[SprintStory]
@@ -50,22 +121,119 @@ class EpicGenerationResult:
 class EpicGenerator:
     """AI-powered epic and story generation for next sprint"""
     
-    def __init__(self, jira_integration: JiraIntegration = None):
+    _SYSTEM_PROMPT: ClassVar[str] = """You are an expert AI Scrum Master and Product Manager. Your task is to generate a comprehensive sprint plan with user stories based on:
+
+1. Product Requirements Document (PRD)
+2. Current backlog items
+3. Recently completed work
+4. Incomplete work from current sprint
+
+Your goal is to create 5-10 user stories for the next sprint that:
+- Align with the PRD objectives
+- Build upon completed work
+- Address any incomplete items from current sprint
+- Consider backlog priorities
+- Stay within story point limits (typically 40 points for a 2-week sprint)
+
+For each story, provide:
+- Clear title and description
+- Detailed acceptance criteria (3-5 criteria each)
+- Story point estimate (1, 2, 3, 5, 8, 13)
+- Priority (High/Medium/Low)
+- Dependencies on other stories
+- Suggested labels/tags
+- Rationale for including in next sprint
+
+Also provide:
+- Overall sprint goal
+- Risk assessment
+- Recommendations for the team
+
+Format your response as a JSON object with the specified structure."""
+    
+    _USER_PROMPT: ClassVar[Template] = Template("""
+PRD Content:
+$prd_content
+
+Current Backlog ($backlog_count items, $backlog_points points):
+$backlog_json
+
+Recently Completed Work ($completed_count items):
+$completed_json
+
+Incomplete Current Sprint Work ($incomplete_count items):
+$incomplete_json
+
+Additional Context:
+$additional_context
+
+Constraints:
+- Maximum $max_stories stories
+- Target ~$target_story_points story points total
+
+Please generate a comprehensive sprint plan with user stories in the following JSON format:
+{
+  "sprint_goal": "Clear, concise sprint goal",
+  "stories": [
+    {
+      "title": "As a [user], I want [goal] so that [benefit]",
+      "description": "Detailed description of the story",
+      "acceptance_criteria": [
+        "Given [context], when [action], then [outcome]",
+        "..."
+      ],
+      "story_points": 5,
+      "priority": "High|Medium|Low", 
+      "dependencies": ["STORY-123", "Another dependency"],
+      "labels": ["frontend", "api", "feature"],
+      "rationale": "Why this story is important for next sprint"
+    }
+  ],
+  "total_story_points": 40,
+  "risk_assessment": "Potential risks and mitigation strategies",
+  "recommendations": ["Recommendation 1", "Recommendation 2"]
+}
+""")
+    
+    def __init__(self, jira_integration: "JiraIntegration" = None, api_key: Optional[str] = None):
         """Initialize epic generator"""
-        self.jira = jira_integration or JiraIntegration()
+        if jira_integration is None:
+            from jira_integration import JiraIntegration
+            jira_integration = JiraIntegration()
+        self.jira = jira_integration
         
         # Initialize OpenAI
-        openai.api_key = OPENAI_API_KEY
-        if not openai.api_key:
+        import openai
+        self._openai = openai
+        api_key = api_key or os.getenv("OPENAI_API_KEY")
+        if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
+        self.client = _openai_client(api_key)
+        self._api_key = api_key
         
         self.logger = logging.getLogger("EpicGenerator")
         
         # Configuration
         self.max_sprint_stories = 10
         self.target_story_points = 40  # Typical 2-week sprint capacity
+        
+        # Response cache
+        self._cache_lock = threading.Lock()
+        self._cache_db = sqlite3.connect(EPIC_CACHE_DB, check_same_thread=False)
+        self._cache_db.execute("""
+            CREATE TABLE IF NOT EXISTS epic_cache (
+                namespace TEXT NOT NULL,
+                prompt_hash TEXT NOT NULL,
+                embedding BLOB,
+                response TEXT NOT NULL,
+                ts INTEGER NOT NULL
+            )
+        """)
+        self._cache_db.execute("CREATE INDEX IF NOT EXISTS idx_epic_cache_namespace ON epic_cache(namespace, ts)")
+        self._cache_db.commit()
     
-    def generate_epic(self, prd_content: str, additional_context: str = "") -> EpicGenerationResult:
+    def generate_epic(self, prd_content: str, additional_context: str = "",
+                      no_cache: bool = False) -> EpicGenerationResult:
         """Generate new epic based on PRD and JIRA context"""
         try:
             # Get JIRA context
@@ -74,11 +242,11 @@ class EpicGenerator:
             # Prepare context for AI
             context = self._prepare_context(prd_content, jira_context, additional_context)
             
-            # Generate stories using AI
-            ai_response = self._call_ai_for_epic_generation(context)
-            
-            # Parse and validate response
-            result = self._parse_ai_response(ai_response)
+            # Generate stories using AI, reusing a cached answer for a near-identical prompt
+            if no_cache:
+                result = self._parse_ai_response(self._call_ai_for_epic_generation(context))
+            else:
+                result = self._generate_with_cache(context)
             
             self.logger.info(f"Generated {len(result.sprint_stories)} stories for next sprint")
             return result
@@ -87,20 +255,46 @@ class EpicGenerator:
             self.logger.error(f"Epic generation failed: {e}")
             raise
     
-    def _prepare_context(self, prd_content: str, jira_context: Dict, additional_context: str) -> Dict:
+    async def generate_epics(self, prd_contents: List[str], additional_context: str = "",
+                             no_cache: bool = False) -> List[EpicGenerationResult]:
+        """Generate one epic per PRD, issuing the AI calls concurrently"""
+        try:
+            # The JIRA context is shared by every PRD, so fetch it once
+            jira_context = await asyncio.to_thread(self.jira.get_project_context)
+            issue_summaries = self._summarize_jira_context(jira_context)
+            contexts = [
+                self._prepare_context(prd_content, jira_context, additional_context, issue_summaries)
+                for prd_content in prd_contents
+            ]
+            
+            # Created per call so they bind to the running event loop
+            semaphore = asyncio.Semaphore(AI_MAX_CONCURRENCY)
+            async with self._async_client() as client:
+                results = await asyncio.gather(*(
+                    self._generate_result_async(client, context, semaphore, no_cache)
+                    for context in contexts
+                ))
+            self.logger.info(
+                f"Generated {sum(len(r.sprint_stories) for r in results)} stories for {len(results)} sprints"
+            )
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Epic generation failed: {e}")
+            raise
+    
+    def _prepare_context(self, prd_content: str, jira_context: Dict, additional_context: str,
+                         issue_summaries: Optional[Dict] = None) -> Dict:
         """Prepare comprehensive context for AI"""
         
-        # Summarize JIRA data
-        backlog_summary = self._summarize_issues(jira_context.get("backlog_issues", []))
-        completed_summary = self._summarize_issues(jira_context.get("completed_issues", []))
-        incomplete_summary = self._summarize_issues(jira_context.get("incomplete_sprint_issues", []))
+        # Summarize JIRA data, unless the caller already did for this JIRA context
+        if issue_summaries is None:
+            issue_summaries = self._summarize_jira_context(jira_context)
         
         context = {
             "prd_content": prd_content,
             "project_info": jira_context.get("project_info", {}),
-            "backlog_summary": backlog_summary,
-            "completed_work_summary": completed_summary,
-            "incomplete_work_summary": incomplete_summary,
+            **issue_summaries,
             "additional_context": additional_context,
             "constraints": {
                 "max_stories": self.max_sprint_stories,
@@ -110,33 +304,39 @@ class EpicGenerator:
         
         return context
     
+    def _summarize_jira_context(self, jira_context: Dict) -> Dict:
+        """Summarize every issue list in the JIRA context, keyed by its context name"""
+        return {
+            name: self._summarize_issues(jira_context.get(source, []))
+            for name, source in _ISSUE_SUMMARIES
+        }
+    
     def _summarize_issues(self, issues: List[Dict]) -> Dict:
         """Summarize JIRA issues for context"""
         if not issues:
-            return {"count": 0, "issues": []}
+            return {"count": 0, "total_story_points": 0, "issues": []}
         
         summarized = []
-        total_points = 0
         
         for issue in issues[:20]:  # Limit to prevent token overflow
+            get = issue.get
             summary = {
-                "key": issue.get("key"),
-                "title": issue.get("summary"),
-                "type": issue.get("issue_type"),
-                "priority": issue.get("priority"),
-                "status": issue.get("status"),
-                "points": issue.get("story_points") or 0
+                "key": get("key"),
+                "title": get("summary"),
+                "type": get("issue_type"),
+                "priority": get("priority"),
+                "status": get("status"),
+                "points": get("story_points") or 0
             }
             
-            if issue.get("description"):
+            description = get("description")
+            if description:
                 # Truncate long descriptions
-                desc = issue["description"][:200]
-                if len(issue["description"]) > 200:
-                    desc += "..."
-                summary["description"] = desc
+                summary["description"] = description if len(description) <= 200 else description[:200] + "..."
             
             summarized.append(summary)
-            total_points += summary["points"]
+        
+        total_points = sum(summary["points"] for summary in summarized)
         
         return {
             "count": len(issues),
@@ -146,83 +346,11 @@ class EpicGenerator:
     
     def _call_ai_for_epic_generation(self, context: Dict) -> str:
         """Call OpenAI API for epic generation"""
-        
-        system_prompt = """You are an expert AI Scrum Master and Product Manager. Your task is to generate a comprehensive sprint plan with user stories based on:
-
-1. Product Requirements Document (PRD)
-2. Current backlog items
-3. Recently completed work
-4. Incomplete work from current sprint
-
-Your goal is to create 5-10 user stories for the next sprint that:
-- Align with the PRD objectives
-- Build upon completed work
-- Address any incomplete items from current sprint
-- Consider backlog priorities
-- Stay within story point limits (typically 40 points for a 2-week sprint)
-
-For each story, provide:
-- Clear title and description
-- Detailed acceptance criteria (3-5 criteria each)
-- Story point estimate (1, 2, 3, 5, 8, 13)
-- Priority (High/Medium/Low)
-- Dependencies on other stories
-- Suggested labels/tags
-- Rationale for including in next sprint
-
-Also provide:
-- Overall sprint goal
-- Risk assessment
-- Recommendations for the team
-
-Format your response as a JSON object with the specified structure."""
-
-        user_prompt = f"""
-PRD Content:
-{context['prd_content']}
-
-Current Backlog ({context['backlog_summary']['count']} items, {context['backlog_summary']['total_story_points']} points):
-{json.dumps(context['backlog_summary']['issues'], indent=2)}
-
-Recently Completed Work ({context['completed_work_summary']['count']} items):
-{json.dumps(context['completed_work_summary']['issues'], indent=2)}
-
-Incomplete Current Sprint Work ({context['incomplete_work_summary']['count']} items):
-{json.dumps(context['incomplete_work_summary']['issues'], indent=2)}
-
-Additional Context:
-{context['additional_context']}
-
-Constraints:
-- Maximum {context['constraints']['max_stories']} stories
-- Target ~{context['constraints']['target_story_points']} story points total
-
-Please generate a comprehensive sprint plan with user stories in the following JSON format:
-{{
-  "sprint_goal": "Clear, concise sprint goal",
-  "stories": [
-    {{
-      "title": "As a [user], I want [goal] so that [benefit]",
-      "description": "Detailed description of the story",
-      "acceptance_criteria": [
-        "Given [context], when [action], then [outcome]",
-        "..."
-      ],
-      "story_points": 5,
-      "priority": "High|Medium|Low", 
-      "dependencies": ["STORY-123", "Another dependency"],
-      "labels": ["frontend", "api", "feature"],
-      "rationale": "Why this story is important for next sprint"
-    }}
-  ],
-  "total_story_points": 40,
-  "risk_assessment": "Potential risks and mitigation strategies",
-  "recommendations": ["Recommendation 1", "Recommendation 2"]
-}}
-"""
+        system_prompt = self._SYSTEM_PROMPT
+        user_prompt = self._build_user_prompt(context)
 
         try:
-            response = openai.chat.completions.create(
+            response = self.client.chat.completions.create(
                 model="gpt-4.1-mini",
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -238,20 +366,160 @@ Please generate a comprehensive sprint plan with user stories in the following J
             self.logger.error(f"OpenAI API call failed: {e}")
             raise
     
+    def _async_client(self):
+        """Create an async OpenAI client; its connection pool belongs to the loop that uses it"""
+        return self._openai.AsyncOpenAI(api_key=self._api_key)
+    
+    async def _generate_result_async(self, client, context: Dict, semaphore: asyncio.Semaphore,
+                                     no_cache: bool) -> EpicGenerationResult:
+        """Generate and parse the epic for one context, going through the response cache unless disabled"""
+        if no_cache:
+            return self._parse_ai_response(await self._call_ai_async(client, context, semaphore))
+        
+        # Cache lookups embed the prompt with the sync client, so keep them off the event loop
+        cached, cache_key = await asyncio.to_thread(self._lookup_cached_response, context)
+        if cached is not None:
+            return self._parse_ai_response(cached)
+        
+        ai_response = await self._call_ai_async(client, context, semaphore)
+        # Parse before caching so a malformed response is never replayed
+        result = self._parse_ai_response(ai_response)
+        await asyncio.to_thread(self._store_cached_response, cache_key, ai_response)
+        return result
+    
+    async def _call_ai_async(self, client, context: Dict, semaphore: asyncio.Semaphore) -> str:
+        """Call OpenAI API for epic generation on the async client, backing off when rate limited"""
+        messages = [
+            {"role": "system", "content": self._SYSTEM_PROMPT},
+            {"role": "user", "content": self._build_user_prompt(context)}
+        ]
+        
+        for attempt in range(AI_MAX_RETRIES):
+            try:
+                async with semaphore:
+                    response = await client.chat.completions.create(
+                        model="gpt-4.1-mini",
+                        messages=messages,
+                        temperature=0.7,
+                        max_tokens=4000
+                    )
+                return response.choices[0].message.content.strip()
+                
+            except self._openai.RateLimitError as e:
+                if attempt == AI_MAX_RETRIES - 1:
+                    self.logger.error(f"OpenAI API call failed after {AI_MAX_RETRIES} attempts: {e}")
+                    raise
+                delay = AI_RETRY_BASE_DELAY * 2 ** attempt
+                self.logger.warning(f"OpenAI rate limit hit, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                
+            except Exception as e:
+                self.logger.error(f"OpenAI API call failed: {e}")
+                raise
+    
+    def _build_user_prompt(self, context: Dict) -> str:
+        """Render the user prompt for epic generation"""
+        backlog = context['backlog_summary']
+        completed = context['completed_work_summary']
+        incomplete = context['incomplete_work_summary']
+        
+        # Compact JSON: the model doesn't need it indented, and it saves prompt tokens
+        return self._USER_PROMPT.substitute(
+            prd_content=context['prd_content'],
+            backlog_count=backlog['count'],
+            backlog_points=backlog['total_story_points'],
+            backlog_json=orjson.dumps(backlog['issues']).decode(),
+            completed_count=completed['count'],
+            completed_json=orjson.dumps(completed['issues']).decode(),
+            incomplete_count=incomplete['count'],
+            incomplete_json=orjson.dumps(incomplete['issues']).decode(),
+            additional_context=context['additional_context'],
+            max_stories=context['constraints']['max_stories'],
+            target_story_points=context['constraints']['target_story_points']
+        )
+    
+    def _generate_with_cache(self, context: Dict) -> EpicGenerationResult:
+        """Parse a cached AI response for the same or a near-identical prompt, calling the AI on a miss"""
+        cached, cache_key = self._lookup_cached_response(context)
+        if cached is not None:
+            return self._parse_ai_response(cached)
+        
+        ai_response = self._call_ai_for_epic_generation(context)
+        # Parse before caching so a malformed response is never replayed
+        result = self._parse_ai_response(ai_response)
+        self._store_cached_response(cache_key, ai_response)
+        return result
+    
+    def _lookup_cached_response(self, context: Dict) -> tuple:
+        """Return (cached response or None, key to store a fresh response under)"""
+        namespace = str(context["project_info"].get("key", ""))
+        user_prompt = self._build_user_prompt(context)
+        prompt_hash = hashlib.sha256(user_prompt.encode("utf-8")).hexdigest()
+        now = int(time.time())
+        
+        with self._cache_lock:
+            self._cache_db.execute("DELETE FROM epic_cache WHERE ts < ?", (now - EPIC_CACHE_TTL,))
+            self._cache_db.commit()
+            row = self._cache_db.execute(
+                "SELECT response FROM epic_cache WHERE namespace = ? AND prompt_hash = ?",
+                (namespace, prompt_hash)
+            ).fetchone()
+        if row:
+            self.logger.info("Using cached epic generation response (exact prompt match)")
+            return row[0], None
+        
+        embedding = self._embed_prompt(user_prompt)
+        if embedding is not None:
+            best_distance, best_response = EPIC_CACHE_MAX_DISTANCE, None
+            with self._cache_lock:
+                rows = self._cache_db.execute(
+                    "SELECT response, embedding FROM epic_cache WHERE namespace = ? AND embedding IS NOT NULL",
+                    (namespace,)
+                ).fetchall()
+            for response, blob in rows:
+                cached = array("f")
+                cached.frombytes(blob)
+                # Both vectors are unit length, so cosine distance is 1 - dot product
+                distance = 1.0 - sum(x * y for x, y in zip(embedding, cached))
+                if distance < best_distance:
+                    best_distance, best_response = distance, response
+            if best_response is not None:
+                self.logger.info(f"Using cached epic generation response (cosine distance {best_distance:.3f})")
+                return best_response, None
+        
+        return None, (namespace, prompt_hash, embedding.tobytes() if embedding is not None else None, now)
+    
+    def _store_cached_response(self, cache_key: tuple, ai_response: str):
+        """Cache an AI response under the key returned by _lookup_cached_response"""
+        namespace, prompt_hash, embedding, now = cache_key
+        with self._cache_lock:
+            self._cache_db.execute(
+                "INSERT INTO epic_cache (namespace, prompt_hash, embedding, response, ts) VALUES (?, ?, ?, ?, ?)",
+                (namespace, prompt_hash, embedding, ai_response, now)
+            )
+            self._cache_db.commit()
+    
+    def _embed_prompt(self, text: str) -> Optional[array]:
+        """Embed a prompt as a unit-length float32 vector, or None if embedding fails"""
+        try:
+            response = self.client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+        except Exception as e:
+            self.logger.warning(f"Prompt embedding failed, skipping semantic cache lookup: {e}")
+            return None
+        
+        vector = response.data[0].embedding
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return array("f", (x / norm for x in vector))
+    
     def _parse_ai_response(self, ai_response: str) -> EpicGenerationResult:
         """Parse AI response into structured result"""
         try:
             # Extract JSON from response (handle potential markdown formatting)
-            json_start = ai_response.find('{')
-            json_end = ai_response.rfind('}') + 1
-            json_str = ai_response[json_start:json_end]
-            
-            data = json.loads(json_str)
+            data = orjson.loads(_extract_json(ai_response))
             
             # Convert stories to SprintStory objects
-            stories = []
-            for story_data in data.get("stories", []):
-                story = SprintStory(
+            stories = [
+                SprintStory(
                     title=story_data.get("title", ""),
                     description=story_data.get("description", ""),
                     acceptance_criteria=story_data.get("acceptance_criteria", []),
@@ -261,12 +529,17 @@ Please generate a comprehensive sprint plan with user stories in the following J
                     labels=story_data.get("labels", []),
                     rationale=story_data.get("rationale", "")
                 )
-                stories.append(story)
+                for story_data in data.get("stories", [])
+            ]
+            
+            total_story_points = data.get("total_story_points")
+            if total_story_points is None:
+                total_story_points = sum(s.story_points for s in stories)
             
             # Create result
             result = EpicGenerationResult(
                 sprint_stories=stories,
-                total_story_points=data.get("total_story_points", sum(s.story_points for s in stories)),
+                total_story_points=total_story_points,
                 sprint_goal=data.get("sprint_goal", ""),
                 rationale="Generated based on PRD and JIRA context",
                 risk_assessment=data.get("risk_assessment", ""),
@@ -276,7 +549,7 @@ Please generate a comprehensive sprint plan with user stories in the following J
             
             return result
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.error(f"Failed to parse AI response as JSON: {e}")
             self.logger.error(f"AI Response: {ai_response[:500]}...")
             raise ValueError(f"Invalid AI response format: {e}")
@@ -287,11 +560,12 @@ Please generate a comprehensive sprint plan with user stories in the following J
     def export_to_jira(self, result: EpicGenerationResult, create_issues: bool = False) -> List[Dict]:
         """Export generated stories to JIRA (optionally create them)"""
         exported_stories = []
+        generated_on = datetime.now().strftime('%Y-%m-%d %H:%M')
         
         for story in result.sprint_stories:
             jira_story_data = {
                 "summary": story.title,
-                "description": self._format_description_for_jira(story),
+                "description": self._format_description_for_jira(story, generated_on),
                 "priority": story.priority,
                 "story_points": story.story_points,
                 "labels": story.labels + ["ai-generated"]
@@ -307,25 +581,23 @@ Please generate a comprehensive sprint plan with user stories in the following J
         
         return exported_stories
     
-    def _format_description_for_jira(self, story: SprintStory) -> str:
+    def _format_description_for_jira(self, story: SprintStory, generated_on: Optional[str] = None) -> str:
         """Format story description for JIRA"""
-        description = f"{story.description}\n\n"
-        description += "h3. Acceptance Criteria\n"
-        
-        for i, criteria in enumerate(story.acceptance_criteria, 1):
-            description += f"# {criteria}\n"
+        parts = [story.description, "\n\nh3. Acceptance Criteria\n"]
+        parts.extend(f"# {criteria}\n" for criteria in story.acceptance_criteria)
         
         if story.dependencies:
-            description += "\nh3. Dependencies\n"
-            for dep in story.dependencies:
-                description += f"* {dep}\n"
+            parts.append("\nh3. Dependencies\n")
+            parts.extend(f"* {dep}\n" for dep in story.dependencies)
         
         if story.rationale:
-            description += f"\nh3. Rationale\n{story.rationale}\n"
+            parts.append(f"\nh3. Rationale\n{story.rationale}\n")
         
-        description += f"\n_Generated by AI on {datetime.now().strftime('%Y-%m-%d %H:%M')}_"
+        if generated_on is None:
+            generated_on = datetime.now().strftime('%Y-%m-%d %H:%M')
+        parts.append(f"\n_Generated by AI on {generated_on}_")
         
-        return description
+        return "".join(parts)
     
     def save_result(self, result: EpicGenerationResult, filename: str = None) -> str:
         """Save generation result to file"""
@@ -333,12 +605,9 @@ Please generate a comprehensive sprint plan with user stories in the following J
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"epic_generation_{timestamp}.json"
         
-        # Convert to serializable format
-        result_dict = asdict(result)
-        result_dict["generated_at"] = result.generated_at.isoformat()
-        
-        with open(filename, 'w') as f:
-            json.dump(result_dict, f, indent=2)
+        # orjson serializes the dataclasses and the generated_at datetime directly
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
         
         self.logger.info(f"Epic generation result saved to {filename}")
         return filename
\ No newline at end of file
@@ -1,23 +1,48 @@
 #!/usr/bin/env python3
 from flask import Flask, request, jsonify
-import threading
-import tempfile
+import atexit
+import logging
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
-from standup_automation import StandupAutomation
-from sprint_report_generator import SprintReportGenerator
 from dotenv import load_dotenv
 
+# The automation modules pull in openai and the report/PDF stack; they are imported
+# on first use so the server starts without paying for them
+if TYPE_CHECKING:
+    from standup_automation import StandupAutomation
+    from sprint_report_generator import SprintReportGenerator
+
 load_dotenv()
 
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
 app = Flask(__name__)
 
 # Vexa API Configuration
 VEXA_API_KEY = os.getenv("VEXA_API_KEY")
 VEXA_BASE_URL = os.getenv("VEXA_BASE_URL")
+VEXA_RETRY_ATTEMPTS = 3
+VEXA_RETRY_BASE_DELAY = 5  # seconds, doubled on every attempt
+VEXA_RETRY_MAX_DELAY = 20
+
+# Keep-alive session so status polls and the transcript fetch reuse one connection
+VEXA_SESSION = requests.Session()
+_vexa_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+VEXA_SESSION.mount("http://", _vexa_adapter)
+VEXA_SESSION.mount("https://", _vexa_adapter)
+VEXA_SESSION.headers.update({'X-API-Key': VEXA_API_KEY or ''})
+atexit.register(VEXA_SESSION.close)
+
+# Bounded pool for background work so request bursts cannot spawn unlimited threads
+EXECUTOR = ThreadPoolExecutor(max_workers=int(os.getenv("ATHENA_WORKERS", "8")))
+atexit.register(EXECUTOR.shutdown, wait=False)
 
 
 def process_transcript(json_data: Dict[str, Any]) -> str:
@@ -33,37 +58,44 @@ def process_transcript(json_data: Dict[str, Any]) -> str:
     
     # Extract meeting metadata
     start_time = json_data.get('start_time', 'Unknown')
-    
-    # Initialize transcript
-    transcript_lines = []
-    transcript_lines.append(f"Meeting Date/Time: {start_time}")
-    transcript_lines.append("")
+    header = f"Meeting Date/Time: {start_time}\n"
     
     # Process segments
     segments = json_data.get('segments', [])
     
-    # Sort segments by start time to ensure chronological order
-    sorted_segments = sorted(segments, key=lambda x: x.get('start', 0))
-    
-    # Collect all text parts
+    # Collect all text parts, checking chronological order on the way
     all_text_parts = []
+    previous_start = float('-inf')
+    in_order = True
     
-    for segment in sorted_segments:
+    for segment in segments:
+        start = segment.get('start', 0)
+        if start < previous_start:
+            in_order = False
+            break
+        previous_start = start
+        
         text = segment.get('text', '').strip()
         
         # Skip empty text segments
-        if not text:
-            continue
-            
-        all_text_parts.append(text)
+        if text:
+            all_text_parts.append(text)
     
-    # Combine all text and clean it
-    if all_text_parts:
-        combined_text = ' '.join(all_text_parts)
-        cleaned_text = clean_text(combined_text)
-        transcript_lines.append(cleaned_text)
+    # Vexa normally emits segments in order; only sort when it didn't
+    if not in_order:
+        all_text_parts = []
+        for segment in sorted(segments, key=lambda x: x.get('start', 0)):
+            text = segment.get('text', '').strip()
+            if text:
+                all_text_parts.append(text)
     
-    return '\n'.join(transcript_lines)
+    if not all_text_parts:
+        return header
+    
+    # Combine all text and clean it; the parts list is released before cleaning
+    combined_text = ' '.join(all_text_parts)
+    del all_text_parts
+    return f"{header}\n{clean_text(combined_text)}"
 
 
 def clean_text(text: str) -> str:
@@ -79,19 +111,22 @@ def clean_text(text: str) -> str:
     # Split into sentences and remove near-duplicates
     sentences = text.split('.')
     cleaned_sentences = []
+    seen = set()
+    # Kept sentences joined by NUL, so one substring search covers all of them
+    kept_text = ''
     
     for sentence in sentences:
         sentence = sentence.strip()
-        if sentence and sentence not in cleaned_sentences:
-            # Check for similar sentences (simple approach)
-            is_duplicate = False
-            for existing in cleaned_sentences:
-                if len(sentence) > 10 and sentence in existing:
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
-                cleaned_sentences.append(sentence)
+        if not sentence or sentence in seen:
+            continue
+        
+        # Check for similar sentences (simple approach)
+        if len(sentence) > 10 and sentence in kept_text:
+            continue
+        
+        cleaned_sentences.append(sentence)
+        seen.add(sentence)
+        kept_text += '\0' + sentence
     
     return '. '.join(cleaned_sentences).strip()
 
@@ -99,60 +134,129 @@ def clean_text(text: str) -> str:
 def fetch_transcript_from_vexa(meeting_id: str):
     """Fetch transcript from Vexa API using meeting ID"""
     try:
-        headers = {'X-API-Key': VEXA_API_KEY}
         url = f"{VEXA_BASE_URL}/transcripts/google_meet/{meeting_id}"
         
-        print(f"🔍 Fetching transcript from: {url}")
-        response = requests.get(url, headers=headers, timeout=30)
+        logger.info("🔍 Fetching transcript from: %s", url)
+        response = VEXA_SESSION.get(url, timeout=30)
         
         if response.status_code == 200:
             return response.json()
         else:
-            print(f"❌ API Error: {response.status_code} - {response.text}")
+            logger.error("❌ API Error: %s - %s", response.status_code, response.text)
             return None
             
     except Exception as e:
-        print(f"❌ Error fetching transcript: {e}")
+        logger.error("❌ Error fetching transcript: %s", e)
         return None
 
 
+@lru_cache(maxsize=4)
+def get_standup_automation(config_path: str) -> "StandupAutomation":
+    """Return the shared StandupAutomation for a config file; it keeps no per-run state"""
+    from standup_automation import StandupAutomation
+    return StandupAutomation(config_path=config_path)
+
+
+@lru_cache(maxsize=4)
+def get_sprint_report_generator(config_path: str) -> "SprintReportGenerator":
+    """Return the shared SprintReportGenerator for a config file; it keeps no per-run state"""
+    from sprint_report_generator import SprintReportGenerator
+    return SprintReportGenerator(config_path=config_path)
+
+
 def run_standup_automation_async(transcript_content):
     """Run standup automation in a separate thread"""
     try:
-        # Create a temporary file for the transcript
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as temp_file:
-            temp_file.write(transcript_content)
-            temp_file_path = temp_file.name
-        
-        # Initialize and run automation
-        automation = StandupAutomation(config_path='config.json')
-        success = automation.run_automation(transcript_path=temp_file_path)
-        
-        # Clean up temp file
-        os.unlink(temp_file_path)
+        # Run automation on the in-memory transcript
+        automation = get_standup_automation('config.json')
+        success = automation.run_automation(transcript_text=transcript_content)
         
         if success:
-            print("✅ Standup automation completed successfully")
+            logger.info("✅ Standup automation completed successfully")
         else:
-            print("❌ Standup automation failed")
+            logger.error("❌ Standup automation failed")
+            
+    except Exception as e:
+        logger.error("Error in async standup automation: %s", e)
+
+
+def process_vexa_webhook_async(meeting_id: str, status: str, filename: str):
+    """Wait for the meeting to complete, then fetch, clean and save its transcript and run standup automation"""
+    try:
+        transcript_data = None
+        if status != 'completed':
+            logger.info("⏳ Meeting not completed yet (status: %s), retrying...", status)
+            
+            # Retry with exponential backoff
+            for attempt in range(VEXA_RETRY_ATTEMPTS):
+                delay = min(VEXA_RETRY_BASE_DELAY * 2 ** attempt, VEXA_RETRY_MAX_DELAY)
+                logger.info("🔄 Retry attempt %s/%s - waiting %s seconds...", attempt + 1, VEXA_RETRY_ATTEMPTS, delay)
+                time.sleep(delay)
+                
+                # Re-fetch the webhook data to check status
+                polled_data = fetch_transcript_from_vexa(meeting_id)
+                if polled_data and polled_data.get('status') == 'completed':
+                    logger.info("✅ Meeting completed on attempt %s", attempt + 1)
+                    status = 'completed'
+                    # The status poll already returned the finished transcript
+                    transcript_data = polled_data
+                    break
+                else:
+                    logger.info("❌ Attempt %s failed - status still not completed", attempt + 1)
             
+            if status != 'completed':
+                logger.error("❌ All retry attempts failed - meeting still not completed")
+                return
+        
+        # Fetch transcript from Vexa API, unless polling already did
+        if transcript_data is None:
+            logger.info("📥 Fetching transcript for meeting: %s", meeting_id)
+            transcript_data = fetch_transcript_from_vexa(meeting_id)
+        
+        if not transcript_data:
+            logger.error("❌ Failed to fetch transcript from Vexa API")
+            return
+        
+        # Process and clean transcript
+        logger.info("🧹 Processing and cleaning transcript...")
+        cleaned_transcript = process_transcript(transcript_data)
+        
+        logger.info("✅ Cleaned transcript for meeting %s (%d chars)", meeting_id, len(cleaned_transcript))
+        # The transcript itself can be large, so it is only logged at DEBUG
+        logger.debug("Cleaned transcript:\n%s", cleaned_transcript)
+        
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            data = cleaned_transcript.encode('utf-8')
+            # os.write may write less than asked for, so loop until everything is out
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        
+        logger.info("💾 Transcript saved to: %s", filename)
+        
+        # Already on a worker thread, so run standup automation here
+        logger.info("🚀 Starting standup automation...")
+        run_standup_automation_async(cleaned_transcript)
+        
     except Exception as e:
-        print(f"Error in async standup automation: {e}")
+        logger.error("❌ Error processing transcript: %s", e)
 
 
 def run_sprint_report_async():
     """Run sprint report generation in a separate thread"""
     try:
-        generator = SprintReportGenerator(config_path='config.json')
+        generator = get_sprint_report_generator('config.json')
         output_path = generator.generate_report()
         
         if output_path:
-            print(f"✅ Sprint report generated successfully: {output_path}")
+            logger.info("✅ Sprint report generated successfully: %s", output_path)
         else:
-            print("❌ Sprint report generation failed")
+            logger.error("❌ Sprint report generation failed")
             
     except Exception as e:
-        print(f"Error in async sprint report generation: {e}")
+        logger.error("Error in async sprint report generation: %s", e)
 
 
 @app.route('/standup', methods=['POST'])
@@ -169,13 +273,8 @@ def process_standup():
         if not transcript.strip():
             return jsonify({'error': 'Empty transcript provided'}), 400
         
-        # Start standup automation in background thread
-        thread = threading.Thread(
-            target=run_standup_automation_async, 
-            args=(transcript,),
-            daemon=True
-        )
-        thread.start()
+        # Start standup automation in the background worker pool
+        EXECUTOR.submit(run_standup_automation_async, transcript)
         
         # Return 200 immediately
         return jsonify({
@@ -201,97 +300,30 @@ def receive_vexa_webhook():
         status = data.get('status')
         start_time = data.get('start_time')
         
-        print(f"\n{'='*80}")
-        print("📨 VEXA WEBHOOK RECEIVED")
-        print("="*80)
-        print(f"Meeting ID: {meeting_id}")
-        print(f"Status: {status}")
-        print(f"Start Time: {start_time}")
-        print("="*80)
+        logger.info("📨 Vexa webhook received - meeting %s, status %s, start time %s",
+                    meeting_id, status, start_time)
         
         if not meeting_id:
-            print("❌ No meeting ID found in webhook")
+            logger.warning("❌ No meeting ID found in webhook")
             return jsonify({"error": "No meeting ID provided"}), 400
         
-        if status != 'completed':
-            print(f"⏳ Meeting not completed yet (status: {status}), retrying...")
-            
-            # Retry up to 3 times with 10-second delays
-            for attempt in range(3):
-                print(f"🔄 Retry attempt {attempt + 1}/3 - waiting 10 seconds...")
-                time.sleep(10)
-                
-                # Re-fetch the webhook data to check status
-                transcript_data = fetch_transcript_from_vexa(meeting_id)
-                if transcript_data and transcript_data.get('status') == 'completed':
-                    print(f"✅ Meeting completed on attempt {attempt + 1}")
-                    status = 'completed'
-                    break
-                else:
-                    print(f"❌ Attempt {attempt + 1} failed - status still not completed")
-            
-            if status != 'completed':
-                print("❌ All retry attempts failed - meeting still not completed")
-                return jsonify({
-                    "status": "failed", 
-                    "message": "Meeting not completed after retries"
-                })
-        
-        # Fetch transcript from Vexa API
-        print(f"📥 Fetching transcript for meeting: {meeting_id}")
-        transcript_data = fetch_transcript_from_vexa(meeting_id)
+        # Retrying, fetching and cleaning can take 30+ seconds, so hand them to a worker
+        # and acknowledge the webhook right away
+        unix_timestamp = int(time.time())
+        filename = f"{unix_timestamp}.txt"
+        EXECUTOR.submit(process_vexa_webhook_async, meeting_id, status, filename)
         
-        if not transcript_data:
-            print("❌ Failed to fetch transcript from Vexa API")
-            return jsonify({"error": "Failed to fetch transcript"}), 500
-        
-        # Process and clean transcript
-        print("🧹 Processing and cleaning transcript...")
-        try:
-            cleaned_transcript = process_transcript(transcript_data)
-            
-            print(f"\n{'='*80}")
-            print("✅ CLEANED TRANSCRIPT OUTPUT")
-            print("="*80)
-            print(f"Meeting ID: {meeting_id}")
-            print(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            print("="*80)
-            print(cleaned_transcript)
-            print("="*80 + "\n")
-            
-            # Save transcript to file with Unix timestamp
-            unix_timestamp = int(time.time())
-            filename = f"{unix_timestamp}.txt"
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(cleaned_transcript)
-            
-            print(f"💾 Transcript saved to: {filename}")
-            
-            # Call standup automation directly with cleaned transcript
-            print("🚀 Starting standup automation...")
-            thread = threading.Thread(
-                target=run_standup_automation_async,
-                args=(cleaned_transcript,),
-                daemon=True
-            )
-            thread.start()
-            
-            return jsonify({
-                "status": "success",
-                "message": "Transcript processed and standup automation started",
-                "meeting_id": meeting_id,
-                "output_file": filename,
-                "unix_timestamp": unix_timestamp,
-                "processed_at": datetime.now().isoformat()
-            })
-            
-        except Exception as e:
-            print(f"❌ Error processing transcript: {e}")
-            return jsonify({"error": f"Failed to process transcript: {str(e)}"}), 500
+        return jsonify({
+            "status": "accepted",
+            "message": "Webhook received, transcript processing started",
+            "meeting_id": meeting_id,
+            "output_file": filename,
+            "unix_timestamp": unix_timestamp,
+            "received_at": datetime.now().isoformat()
+        }), 202
         
     except Exception as e:
-        print(f"❌ Webhook error: {e}")
+        logger.error("❌ Webhook error: %s", e)
         return jsonify({"error": f"Webhook processing failed: {str(e)}"}), 500
 
 
@@ -309,12 +341,8 @@ def process_sprint_report():
         if not sprint_comp:
             return jsonify({'error': 'sprint_comp must be True'}), 400
         
-        # Start sprint report generation in background thread
-        thread = threading.Thread(
-            target=run_sprint_report_async,
-            daemon=True
-        )
-        thread.start()
+        # Start sprint report generation in the background worker pool
+        EXECUTOR.submit(run_sprint_report_async)
         
         # Return 200 immediately
         return jsonify({
@@ -328,8 +356,12 @@ def process_sprint_report():
 
 @app.route('/health', methods=['GET'])
 def health_check():
-    return jsonify({'status': 'healthy'}), 200
+    return jsonify({
+        'status': 'healthy',
+        'queued_tasks': EXECUTOR._work_queue.qsize()
+    }), 200
 
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Development server only; serve production traffic with `gunicorn wsgi:application`
+    app.run(host='0.0.0.0', port=5000, debug=os.getenv("FLASK_DEBUG") == "1")
@@ -0,0 +1,13 @@
+"""Gunicorn settings for serving flask_server through wsgi.py"""
+
+import multiprocessing
+import os
+
+bind = os.getenv("ATHENA_BIND", "0.0.0.0:5000")
+
+# Threaded workers: /transcript and the background pool spend most of their time
+# waiting on Vexa, JIRA and OpenAI, so threads keep the worker count low
+worker_class = "gthread"
+workers = int(os.getenv("ATHENA_WEB_WORKERS", multiprocessing.cpu_count()))
+threads = int(os.getenv("ATHENA_WEB_THREADS", "16"))
+timeout = 60
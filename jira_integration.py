@@ -6,11 +6,16 @@ Handles JIRA API interactions for fetching backlogs, completed tasks, and managi
 
 import json
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any
 from datetime import datetime, timedelta
-import base64
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 import os
 
@@ -20,6 +25,23 @@ load_dotenv()
 class JiraIntegration:
     """JIRA API integration for fetching project data"""
     
+    # Only the fields format_issue_for_context reads, instead of hydrating every custom field
+    CONTEXT_FIELDS = "summary,description,issuetype,priority,status,assignee,labels,components,created,updated,customfield_10016"
+    
+    # Issues requested per search page; JIRA lowers this to its own limit when that is smaller
+    SEARCH_BATCH_SIZE = 500
+    
+    JSON_BODY_HEADERS = {"Content-Type": "application/json"}
+    
+    # Lower-cased status names that count as finished work
+    DONE_STATUSES = ("done", "closed", "resolved")
+    
+    # Lookups whose data rarely changes are cached across instances: url -> (expires_at, response)
+    PROJECT_INFO_TTL = 600  # seconds
+    BOARD_TTL = 3600
+    _lookup_cache: Dict[str, tuple] = {}
+    _lookup_cache_lock = threading.Lock()
+    
     def __init__(self, base_url: str = None, username: str = None, api_token: str = None, project_key: str = None):
         """Initialize JIRA integration"""
         self.base_url = base_url or os.getenv("JIRA_BASE_URL")
@@ -33,31 +55,59 @@ class JiraIntegration:
         # Remove trailing slash
         self.base_url = self.base_url.rstrip('/')
         
-        # Setup authentication
-        self.auth_string = base64.b64encode(f"{self.username}:{self.api_token}".encode()).decode()
+        # Content-Type is sent only with requests that carry a JSON body
         self.headers = {
-            "Authorization": f"Basic {self.auth_string}",
-            "Content-Type": "application/json",
             "Accept": "application/json"
         }
         
         self.logger = logging.getLogger("JiraIntegration")
         
+        # Keep-alive session shared by all requests, including the concurrent context lookups
+        self.session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Searches are read-only POSTs, so they may be retried too; other POSTs such as
+        # issue creation keep the default method list and are never sent twice
+        search_adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=20,
+            max_retries=retry.new(allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"})
+        )
+        self.session.mount(f"{self.base_url}/rest/api/3/search", search_adapter)
+        self.session.headers.update(self.headers)
+        self.session.auth = (self.username, self.api_token)
+        
+        # The project's board rarely changes, so it is looked up once per instance
+        self._board_id: Optional[int] = None
+        
     def _make_request(self, endpoint: str, method: str = "GET", data: Dict = None) -> Optional[Dict]:
         """Make authenticated request to JIRA API"""
         url = f"{self.base_url}/rest/api/3{endpoint}"
         
+        # Bodies are encoded with orjson here rather than through requests' json= (stdlib json)
+        body, headers = None, None
+        if data is not None:
+            body = orjson.dumps(data)
+            headers = self.JSON_BODY_HEADERS
+        
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
-                headers=self.headers,
-                json=data,
+                data=body,
+                headers=headers,
                 timeout=30
             )
             
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 self.logger.error(f"JIRA API error {response.status_code}: {response.text}")
                 return None
@@ -66,97 +116,166 @@ class JiraIntegration:
             self.logger.error(f"JIRA API request failed: {e}")
             return None
     
+    def _cached_request(self, endpoint: str, ttl: float) -> Optional[Dict]:
+        """GET endpoint, reusing a successful response for ttl seconds"""
+        key = f"{self.base_url}{endpoint}"
+        now = time.monotonic()
+        with self._lookup_cache_lock:
+            cached = self._lookup_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+        
+        response = self._make_request(endpoint)
+        if response is not None:
+            with self._lookup_cache_lock:
+                self._lookup_cache[key] = (now + ttl, response)
+        return response
+    
+    def search(self, jql: str, fields: str = CONTEXT_FIELDS, start_at: int = 0,
+               max_results: int = 50) -> Optional[Dict]:
+        """Run one page of a JQL search, sending the query as a JSON body so it needs no URL encoding"""
+        return self._make_request("/search", method="POST", data={
+            "jql": jql,
+            "fields": fields.split(","),
+            "startAt": start_at,
+            "maxResults": max_results
+        })
+    
+    def _paginated_search(self, jql: str, fields: str = CONTEXT_FIELDS,
+                          max_results: Optional[int] = None) -> Iterator[Dict]:
+        """Yield issues matching jql page by page, up to max_results (all when None)"""
+        start_at = 0
+        while max_results is None or start_at < max_results:
+            batch_size = self.SEARCH_BATCH_SIZE
+            if max_results is not None:
+                batch_size = min(batch_size, max_results - start_at)
+            
+            response = self.search(jql, fields, start_at, batch_size)
+            issues = response.get("issues", []) if response else []
+            yield from issues
+            
+            start_at += len(issues)
+            if not issues or start_at >= response.get("total", 0):
+                return
+    
     def get_project_info(self) -> Optional[Dict]:
         """Get basic project information"""
-        return self._make_request(f"/project/{self.project_key}")
+        return self._cached_request(f"/project/{self.project_key}", self.PROJECT_INFO_TTL)
     
-    def get_backlog_issues(self, max_results: int = 50) -> List[Dict]:
-        """Get backlog issues (not in active sprint)"""
+    def get_backlog_issues(self, max_results: Optional[int] = 50) -> List[Dict]:
+        """Get backlog issues (not in active sprint), up to max_results (all when None)"""
+        return list(self.iter_backlog_issues(max_results))
+    
+    def iter_backlog_issues(self, max_results: Optional[int] = 50) -> Iterator[Dict]:
+        """Stream backlog issues page by page, up to max_results (all when None)"""
         # Updated JQL to better capture backlog items
         jql = f'project = "{self.project_key}" AND status NOT IN ("Done", "Closed", "Resolved") AND sprint is EMPTY ORDER BY priority DESC, created ASC'
         
-        response = self._make_request(f"/search?jql={jql}&maxResults={max_results}&fields=*all")
-        if response:
-            return response.get("issues", [])
-        return []
+        return self._paginated_search(jql, max_results=max_results)
+    
+    def get_completed_issues(self, days_back: int = 30, max_results: Optional[int] = 100) -> List[Dict]:
+        """Get completed issues from recent sprints, up to max_results (all when None)"""
+        return list(self.iter_completed_issues(days_back, max_results))
     
-    def get_completed_issues(self, days_back: int = 30) -> List[Dict]:
-        """Get completed issues from recent sprints"""
+    def iter_completed_issues(self, days_back: int = 30, max_results: Optional[int] = 100) -> Iterator[Dict]:
+        """Stream completed issues from recent sprints page by page, up to max_results (all when None)"""
         since_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
         jql = f'project = "{self.project_key}" AND status IN ("Done", "Closed", "Resolved") AND resolved >= "{since_date}" ORDER BY resolved DESC'
         
-        response = self._make_request(f"/search?jql={jql}&maxResults=100&fields=*all")
-        if response:
-            return response.get("issues", [])
-        return []
+        return self._paginated_search(jql, max_results=max_results)
     
     def get_active_sprint_issues(self) -> List[Dict]:
         """Get issues in active sprint"""
+        return list(self.iter_active_sprint_issues())
+    
+    def iter_active_sprint_issues(self) -> Iterator[Dict]:
+        """Stream issues in active sprint page by page"""
         # Get active sprints for the project
         board_id = self._get_board_id()
         if not board_id:
-            return []
+            return
         
         sprints_response = self._make_request(f"/board/{board_id}/sprint?state=active")
         if not sprints_response or not sprints_response.get("values"):
-            return []
+            return
         
         active_sprint = sprints_response["values"][0]
         sprint_id = active_sprint["id"]
         
         # Get issues in active sprint
         jql = f'project = "{self.project_key}" AND sprint = {sprint_id} ORDER BY status ASC'
-        response = self._make_request(f"/search?jql={jql}&maxResults=100")
-        if response:
-            return response.get("issues", [])
-        return []
-    
-    def get_incomplete_sprint_issues(self) -> List[Dict]:
-        """Get incomplete issues from active sprint"""
-        active_issues = self.get_active_sprint_issues()
+        yield from self._paginated_search(jql)
+    
+    def get_incomplete_sprint_issues(self, active_issues: List[Dict] = None) -> List[Dict]:
+        """Get incomplete issues from active sprint, fetching it unless already given"""
+        if active_issues is None:
+            active_issues = self.get_active_sprint_issues()
         incomplete_issues = []
         
         for issue in active_issues:
             status = issue["fields"]["status"]["name"]
-            if status.lower() not in ["done", "closed", "resolved"]:
+            if status.lower() not in self.DONE_STATUSES:
                 incomplete_issues.append(issue)
         
         return incomplete_issues
     
     def _get_board_id(self) -> Optional[int]:
         """Get the first board ID for the project"""
-        response = self._make_request("/board?projectKeyOrId=" + self.project_key)
-        if response and response.get("values"):
-            return response["values"][0]["id"]
-        return None
+        if self._board_id is None:
+            response = self._cached_request("/board?projectKeyOrId=" + self.project_key, self.BOARD_TTL)
+            if response and response.get("values"):
+                self._board_id = response["values"][0]["id"]
+        return self._board_id
     
     def format_issue_for_context(self, issue: Dict) -> Dict:
         """Format JIRA issue for use in AI prompts"""
-        fields = issue.get("fields", {})
+        get = (issue.get("fields") or {}).get
+        # JIRA sends null for unset objects, so guard each one once
+        issue_type = get("issuetype") or {}
+        priority = get("priority") or {}
+        status = get("status") or {}
+        assignee = get("assignee")
         
         return {
             "key": issue.get("key"),
-            "summary": fields.get("summary"),
-            "description": fields.get("description", ""),
-            "issue_type": fields.get("issuetype", {}).get("name"),
-            "priority": fields.get("priority", {}).get("name"),
-            "status": fields.get("status", {}).get("name"),
-            "assignee": fields.get("assignee", {}).get("displayName") if fields.get("assignee") else None,
-            "story_points": fields.get("customfield_10016"),  # Common story points field
-            "labels": fields.get("labels", []),
-            "components": [c["name"] for c in fields.get("components", [])],
-            "created": fields.get("created"),
-            "updated": fields.get("updated")
+            "summary": get("summary"),
+            "description": get("description", ""),
+            "issue_type": issue_type.get("name"),
+            "priority": priority.get("name"),
+            "status": status.get("name"),
+            "assignee": assignee.get("displayName") if assignee else None,
+            "story_points": get("customfield_10016"),  # Common story points field
+            "labels": get("labels", []),
+            "components": [c["name"] for c in get("components") or ()],
+            "created": get("created"),
+            "updated": get("updated")
         }
     
+    def _format_issues(self, issues: Iterator[Dict]) -> List[Dict]:
+        """Format streamed issues as they arrive, so the raw pages are never held as one list"""
+        return list(map(self.format_issue_for_context, issues))
+    
     def get_project_context(self) -> Dict:
         """Get comprehensive project context for epic generation"""
+        # The lookups are independent and bound by JIRA latency, so run them concurrently
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            project_info = pool.submit(self.get_project_info)
+            backlog_issues = pool.submit(self._format_issues, self.iter_backlog_issues())
+            completed_issues = pool.submit(self._format_issues, self.iter_completed_issues())
+            active_sprint_issues = pool.submit(self._format_issues, self.iter_active_sprint_issues())
+        
+        # Incomplete sprint work is a subset of the active sprint, so filter it locally
+        active_issues = active_sprint_issues.result()
+        
         context = {
-            "project_info": self.get_project_info(),
-            "backlog_issues": [self.format_issue_for_context(issue) for issue in self.get_backlog_issues()],
-            "completed_issues": [self.format_issue_for_context(issue) for issue in self.get_completed_issues()],
-            "incomplete_sprint_issues": [self.format_issue_for_context(issue) for issue in self.get_incomplete_sprint_issues()],
-            "active_sprint_issues": [self.format_issue_for_context(issue) for issue in self.get_active_sprint_issues()]
+            "project_info": project_info.result(),
+            "backlog_issues": backlog_issues.result(),
+            "completed_issues": completed_issues.result(),
+            "incomplete_sprint_issues": [
+                issue for issue in active_issues
+                if (issue["status"] or "").lower() not in self.DONE_STATUSES
+            ],
+            "active_sprint_issues": active_issues
         }
         
         self.logger.info(f"Retrieved JIRA context: "
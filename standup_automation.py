@@ -286,8 +286,10 @@ class StandupAutomation:
         PREVIOUS DAYS SUMMARIES:
         """
         
-        for summary in previous_summaries:
-            prompt += f"{json.dumps(summary['summary'], indent=2)}\n----------\n"
+        # Compact JSON: the model doesn't need it indented, and it saves prompt tokens
+        prompt += "".join(
+            f"{json.dumps(summary['summary'])}\n----------\n" for summary in previous_summaries
+        )
         
         prompt += """
         
@@ -445,11 +447,17 @@ class StandupAutomation:
         logger.info("Processing unknown trigger type")
         return self.run_automation(transcript_path, "unknown")
     
-    def run_automation(self, transcript_path: str, trigger_event: str='Standup') -> bool:
-        """Run the complete automation pipeline."""
+    def run_automation(self, transcript_path: Optional[str] = None, trigger_event: str='Standup',
+                       transcript_text: Optional[str] = None) -> bool:
+        """Run the complete automation pipeline on a transcript given in memory or by path."""
         try:
-            # Read transcript
-            transcript = self.read_transcript(transcript_path)
+            # Read transcript, unless the caller already has it in memory
+            if transcript_text is not None:
+                transcript = transcript_text
+            elif transcript_path:
+                transcript = self.read_transcript(transcript_path)
+            else:
+                raise ValueError("Either transcript_text or transcript_path is required")
             if not transcript:
                 logger.error("No transcript content found")
                 return False
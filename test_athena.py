@@ -6,6 +6,8 @@ Simple test script for Athena Meeting Bot functionality
 import asyncio
 import json
 import os
+import pickle
+import tempfile
 from datetime import datetime
 from dotenv import load_dotenv
 from athena_meet_bot import AthenaMeetBot, MeetingSession, MeetingStatus
@@ -142,6 +144,112 @@ async def test_meeting_creation():
         return False
 
 
+async def test_session_persistence():
+    """Test that sessions survive a save and reload, and that deletes are persisted"""
+    print("\nTesting session persistence...")
+    
+    config_path = os.path.abspath("athena_config.json")
+    original_dir = os.getcwd()
+    
+    try:
+        # The session database lives in the working directory
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            
+            bot = AthenaMeetBot(config_path)
+            session = MeetingSession(
+                meeting_id="persist-session",
+                google_meet_url="https://meet.google.com/abc-defg-hij",
+                google_meet_id="abc-defg-hij",
+                start_time=datetime(2030, 1, 2, 9, 0),
+                end_time=datetime(2030, 1, 2, 9, 30),
+                status=MeetingStatus.BOT_JOINING,
+                bot_session_id="bot-123"
+            )
+            bot._active_sessions[session.meeting_id] = session
+            bot._mark_dirty(session)
+            await bot.close()
+            
+            # A new bot loads the saved session
+            bot = AthenaMeetBot(config_path)
+            loaded = bot._active_sessions.get("persist-session")
+            if loaded is None:
+                print("❌ Saved session was not loaded")
+                return False
+            for field in ("google_meet_url", "google_meet_id", "start_time",
+                          "end_time", "status", "bot_session_id"):
+                if getattr(loaded, field) != getattr(session, field):
+                    print(f"❌ Loaded session has a different {field}")
+                    return False
+            print("✅ Session saved and loaded")
+            
+            # Removing the session deletes its row on the next save
+            del bot._active_sessions["persist-session"]
+            bot._dirty.add("persist-session")
+            await bot.close()
+            
+            bot = AthenaMeetBot(config_path)
+            found = "persist-session" in bot._active_sessions
+            await bot.close()
+            if found:
+                print("❌ Deleted session was loaded again")
+                return False
+            print("✅ Session delete persisted")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Session persistence test failed: {e}")
+        return False
+    finally:
+        os.chdir(original_dir)
+
+
+async def test_legacy_session_import():
+    """Test that sessions in an old active_sessions.pkl are imported once into the session database"""
+    print("\nTesting legacy session import...")
+    
+    config_path = os.path.abspath("athena_config.json")
+    original_dir = os.getcwd()
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            
+            # Written in the format the pickle-based bot used
+            with open("active_sessions.pkl", "wb") as f:
+                pickle.dump({
+                    "legacy-session": {
+                        "meeting_id": "legacy-session",
+                        "google_meet_url": "https://meet.google.com/abc-defg-hij",
+                        "google_meet_id": "abc-defg-hij",
+                        "start_time": datetime(2030, 1, 2, 9, 0),
+                        "end_time": None,
+                        "status": "created",
+                        "bot_session_id": None
+                    }
+                }, f)
+            
+            bot = AthenaMeetBot(config_path)
+            imported = bot._active_sessions.get("legacy-session")
+            await bot.close()
+            if imported is None or imported.start_time != datetime(2030, 1, 2, 9, 0):
+                print("❌ Legacy session was not imported")
+                return False
+            if os.path.exists("active_sessions.pkl") or not os.path.exists("active_sessions.pkl.imported"):
+                print("❌ Legacy session file was not renamed after the import")
+                return False
+            print("✅ Legacy session imported and file renamed")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Legacy session import test failed: {e}")
+        return False
+    finally:
+        os.chdir(original_dir)
+
+
 async def run_all_tests():
     """Run all tests"""
     print("🤖 Athena Meeting Bot - System Test\n")
@@ -152,6 +260,8 @@ async def run_all_tests():
         ("Google Calendar", test_google_calendar),
         ("Webhook", test_webhook),
         ("Meeting Creation", test_meeting_creation),
+        ("Session Persistence", test_session_persistence),
+        ("Legacy Session Import", test_legacy_session_import),
     ]
     
     passed = 0
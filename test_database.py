@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Test script for the standup database schema migration
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+
+from database import BLOB_COLUMNS, READER_POOL_SIZE, StandupDatabase
+
+# Schema written by the original single-table database module
+BASELINE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS standups (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        date TEXT NOT NULL,
+        description TEXT NOT NULL,
+        trigger_event TEXT,
+        transcript_path TEXT,
+        teams_context TEXT,
+        previous_summaries TEXT,
+        raw_transcript TEXT,
+        slack_posted BOOLEAN DEFAULT FALSE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_standups_date ON standups(date);
+"""
+
+# One standup with every large column filled and one with none
+BASELINE_ROWS = [
+    {
+        "date": "2025-08-20",
+        "description": "Standup with attachments",
+        "trigger_event": "manual",
+        "transcript_path": "transcripts/2025-08-20.txt",
+        "teams_context": "Team context",
+        "previous_summaries": "Earlier summaries",
+        "raw_transcript": "Alice: done with login. Bob: working on search.",
+        "slack_posted": "TRUE",
+    },
+    {
+        "date": "2025-08-21",
+        "description": "Standup without attachments",
+        "trigger_event": "scheduled",
+        "transcript_path": None,
+        "teams_context": None,
+        "previous_summaries": None,
+        "raw_transcript": None,
+        "slack_posted": "FALSE",
+    },
+]
+
+
+def create_baseline_database(db_path: str):
+    """Write a database file in the baseline schema with sample rows"""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(BASELINE_SCHEMA)
+        conn.executemany("""
+            INSERT INTO standups (
+                date, description, trigger_event, transcript_path, teams_context,
+                previous_summaries, raw_transcript, slack_posted
+            ) VALUES (
+                :date, :description, :trigger_event, :transcript_path, :teams_context,
+                :previous_summaries, :raw_transcript, :slack_posted
+            )
+        """, BASELINE_ROWS)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_baseline_migration() -> bool:
+    """Test that opening a baseline database moves the large columns into standups_blobs"""
+    print("Testing baseline schema migration...")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "standups.db")
+        create_baseline_database(db_path)
+        
+        db = StandupDatabase(db_path)
+        try:
+            # The large columns are gone from the standups table
+            with db._read() as conn:
+                columns = {row["name"] for row in conn.execute("PRAGMA table_info(standups)")}
+                blob_rows = conn.execute("SELECT COUNT(*) FROM standups_blobs").fetchone()[0]
+            left_behind = columns.intersection(BLOB_COLUMNS)
+            if left_behind:
+                print(f"❌ Columns still in standups: {', '.join(sorted(left_behind))}")
+                return False
+            if blob_rows != 1:
+                print(f"❌ Expected 1 row in standups_blobs, found {blob_rows}")
+                return False
+            print("✅ Large columns moved into standups_blobs")
+            
+            # Each standup reads back with its original values
+            for expected in BASELINE_ROWS:
+                standup = db.get_standup_by_date(expected["date"], with_blobs=True)
+                if standup is None:
+                    print(f"❌ Standup for {expected['date']} not found")
+                    return False
+                for column in ("description", "trigger_event") + BLOB_COLUMNS:
+                    if standup[column] != expected[column]:
+                        print(f"❌ {column} changed for {expected['date']}: {standup[column]!r}")
+                        return False
+                if standup["slack_posted"] != (expected["slack_posted"] == "TRUE"):
+                    print(f"❌ slack_posted not normalized for {expected['date']}")
+                    return False
+            print("✅ Migrated standups read back unchanged")
+            
+            # Reads without blobs no longer carry the large columns
+            standup = db.get_standup_by_date(BASELINE_ROWS[0]["date"])
+            if standup is None or "raw_transcript" in standup:
+                print("❌ Plain read returned the large columns")
+                return False
+            print("✅ Plain reads skip the large columns")
+        finally:
+            db.close()
+        
+        # Reopening a migrated file leaves it as is
+        db = StandupDatabase(db_path)
+        try:
+            standup = db.get_standup_by_date(BASELINE_ROWS[0]["date"], with_blobs=True)
+            if standup is None or standup["raw_transcript"] != BASELINE_ROWS[0]["raw_transcript"]:
+                print("❌ Reopened database lost the migrated transcript")
+                return False
+            print("✅ Reopened database still reads the migrated transcript")
+        finally:
+            db.close()
+    
+    return True
+
+
+def test_close_with_reader_checked_out() -> bool:
+    """Test that close() returns while a reader connection is still borrowed"""
+    print("\nTesting close with a reader checked out...")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = StandupDatabase(os.path.join(tmp_dir, "standups.db"))
+        with db._read():
+            closer = threading.Thread(target=db.close, daemon=True)
+            closer.start()
+            closer.join(timeout=5)
+        if closer.is_alive():
+            print("❌ close() blocked on the borrowed reader")
+            return False
+        print("✅ close() returned with a reader checked out")
+    
+    return True
+
+
+def test_in_memory_database() -> bool:
+    """Test that ":memory:" shares one in-memory database and writes no file"""
+    print("\nTesting in-memory database...")
+    
+    original_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.chdir(tmp_dir)
+        try:
+            db = StandupDatabase(":memory:")
+            try:
+                standup_id = db.save_standup("2025-08-22", "In-memory standup", raw_transcript="Hi")
+                standup = db.get_standup_by_id(standup_id, with_blobs=True)
+            finally:
+                db.close()
+            created = os.listdir(tmp_dir)
+        finally:
+            os.chdir(original_dir)
+    
+    if standup is None or standup["raw_transcript"] != "Hi":
+        print("❌ Readers did not see the in-memory standup")
+        return False
+    if created:
+        print(f"❌ In-memory database created files: {', '.join(created)}")
+        return False
+    print("✅ In-memory standup read back without creating files")
+    
+    return True
+
+
+def test_abandoned_iterators() -> bool:
+    """Test that partly read iter_standups() generators do not use up the reader pool"""
+    print("\nTesting abandoned listing iterators...")
+    
+    db = StandupDatabase(":memory:")
+    try:
+        db.save_standups_bulk([
+            {"date": f"2025-08-{day:02d}", "description": f"Standup {day}"} for day in range(1, 6)
+        ])
+        
+        # Leave as many iterators half read as there are pooled readers
+        iterators = [db.iter_standups() for _ in range(READER_POOL_SIZE)]
+        for iterator in iterators:
+            next(iterator)
+        
+        reader = threading.Thread(target=db.list_standups, daemon=True)
+        reader.start()
+        reader.join(timeout=5)
+        if reader.is_alive():
+            print("❌ Listing blocked waiting for a pooled reader")
+            return False
+        print("✅ Listing still runs with iterators left open")
+        
+        listed = [standup["date"] for standup in db.iter_standups(limit=3)]
+        if listed != ["2025-08-05", "2025-08-04", "2025-08-03"]:
+            print(f"❌ Unexpected listing order: {listed}")
+            return False
+        print("✅ Listing returns the newest standups first")
+    finally:
+        db.close()
+    
+    return True
+
+
+def main():
+    """Run all database tests"""
+    tests = [
+        ("Baseline migration", test_baseline_migration),
+        ("Close with reader checked out", test_close_with_reader_checked_out),
+        ("In-memory database", test_in_memory_database),
+        ("Abandoned iterators", test_abandoned_iterators),
+    ]
+    
+    passed = 0
+    for test_name, test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+                print(f"✅ {test_name} test PASSED")
+            else:
+                print(f"❌ {test_name} test FAILED")
+        except Exception as e:
+            print(f"❌ {test_name} test ERROR: {e}")
+    
+    print(f"\nTest Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if main() else 1)
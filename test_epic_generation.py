@@ -6,9 +6,13 @@ Demonstrates the complete workflow of generating new sprint stories
 
 import os
 import json
+import asyncio
 import logging
+import tempfile
 from datetime import datetime
+from types import SimpleNamespace
 
+import epic_generator
 from epic_generator import EpicGenerator, SprintStory, EpicGenerationResult
 from jira_integration import JiraIntegration
 
@@ -226,7 +230,8 @@ def test_epic_generation_with_mock_data():
         mock_jira = MockJiraIntegration()
         generator = MockEpicGenerator(mock_jira)
         
-        result = generator.generate_epic(SAMPLE_PRD, "Testing epic generation with mock data")
+        # Skip the response cache, which would embed the prompt through the real OpenAI API
+        result = generator.generate_epic(SAMPLE_PRD, "Testing epic generation with mock data", no_cache=True)
         
         logger.info("✓ Epic generation completed successfully!")
         logger.info(f"✓ Generated {len(result.sprint_stories)} stories")
@@ -266,6 +271,97 @@ def test_epic_generation_with_mock_data():
         logger.error(f"✗ Epic generation failed: {e}")
         return None
 
+def test_generate_epics_with_mock_client():
+    """Test concurrent epic generation, rate limit retries and the response cache with a mock async client"""
+    logger.info("Testing concurrent epic generation with a mock OpenAI client...")
+    
+    import httpx
+    import openai
+    
+    class MockJiraIntegration:
+        def get_project_context(self):
+            return {
+                "project_info": {"name": "SCRUM Project", "key": "SCRUM"},
+                "backlog_issues": [],
+                "completed_issues": [],
+                "incomplete_sprint_issues": []
+            }
+    
+    prds = [f"{SAMPLE_PRD}\nRelease {n}" for n in range(3)]
+    stats = {"calls": 0, "in_flight": 0, "max_in_flight": 0, "clients": []}
+    
+    class MockAsyncClient:
+        """Stands in for openai.AsyncOpenAI; the first request is rate limited once"""
+        def __init__(self):
+            self.chat = SimpleNamespace(completions=self)
+            self.closed = False
+        
+        async def __aenter__(self):
+            return self
+        
+        async def __aexit__(self, *exc_info):
+            self.closed = True
+        
+        async def create(self, **kwargs):
+            stats["calls"] += 1
+            if stats["calls"] == 1:
+                request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+                raise openai.RateLimitError("Rate limit reached", response=httpx.Response(429, request=request), body=None)
+            
+            stats["in_flight"] += 1
+            stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            await asyncio.sleep(0.01)
+            stats["in_flight"] -= 1
+            
+            release = next(n for n in range(3) if f"Release {n}" in kwargs["messages"][1]["content"])
+            content = json.dumps({"sprint_goal": f"Goal {release}", "stories": [{"title": f"Story {release}"}]})
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+    
+    class MockEpicGenerator(EpicGenerator):
+        def _async_client(self):
+            client = MockAsyncClient()
+            stats["clients"].append(client)
+            return client
+        
+        def _embed_prompt(self, text):
+            # Exact prompt matches only; no embeddings API
+            return None
+    
+    original_cache_db, original_delay = epic_generator.EPIC_CACHE_DB, epic_generator.AI_RETRY_BASE_DELAY
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            epic_generator.EPIC_CACHE_DB = os.path.join(tmp_dir, "epic_cache.db")
+            epic_generator.AI_RETRY_BASE_DELAY = 0
+            generator = MockEpicGenerator(MockJiraIntegration(), api_key="test-key")
+            
+            # Each run gets its own event loop, as separate asyncio.run() calls do
+            results = asyncio.run(generator.generate_epics(prds))
+            goals = [result.sprint_goal for result in results]
+            assert goals == ["Goal 0", "Goal 1", "Goal 2"], f"results out of order: {goals}"
+            assert stats["calls"] == 4, f"expected 3 calls plus 1 retry, got {stats['calls']}"
+            assert stats["max_in_flight"] > 1, "AI calls did not run concurrently"
+            logger.info("✓ Concurrent generation retried the rate limited call")
+            
+            results = asyncio.run(generator.generate_epics(prds))
+            assert [result.sprint_goal for result in results] == goals, "cached results differ"
+            assert stats["calls"] == 4, "second run called the AI instead of using the cache"
+            logger.info("✓ Second run served from the response cache")
+            
+            asyncio.run(generator.generate_epics(prds, no_cache=True))
+            assert stats["calls"] == 7, "no_cache run did not call the AI for every PRD"
+            
+            assert len(stats["clients"]) == 3, "async client was reused across event loops"
+            assert all(client.closed for client in stats["clients"]), "async client was left open"
+            logger.info("✓ Each run used and closed its own async client")
+            generator._cache_db.close()
+        return True
+        
+    except Exception as e:
+        logger.error(f"✗ Concurrent epic generation test failed: {e}")
+        return False
+    finally:
+        epic_generator.EPIC_CACHE_DB, epic_generator.AI_RETRY_BASE_DELAY = original_cache_db, original_delay
+
 def test_jira_export(result: EpicGenerationResult, jira: JiraIntegration):
     """Test exporting generated stories to JIRA"""
     if not result or not jira:
@@ -317,6 +413,9 @@ def main():
     else:
         result = test_epic_generation_with_mock_data()
     
+    # Test concurrent generation with a mock async client
+    concurrent_ok = test_generate_epics_with_mock_client()
+    
     # Test JIRA export
     test_jira_export(result, jira)
     
@@ -330,6 +429,11 @@ def main():
         print(f"✓ Total story points: {result.total_story_points}")
     else:
         print("✗ Epic generation test FAILED")
+    
+    if concurrent_ok:
+        print("✓ Concurrent epic generation test PASSED")
+    else:
+        print("✗ Concurrent epic generation test FAILED")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
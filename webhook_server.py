@@ -6,12 +6,43 @@ Simple webhook server for testing Athena bot transcript delivery
 import json
 import hmac
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from flask import Flask, request, jsonify
 import os
 
 app = Flask(__name__)
 
+# Full payloads and transcripts can be many MB; only a preview is printed unless WEBHOOK_DEBUG=1
+DEBUG_PAYLOADS = os.getenv('WEBHOOK_DEBUG') == '1'
+PREVIEW_CHARS = 500
+
+# Saving and any follow-up processing run here so the webhook is acknowledged right away
+executor = ThreadPoolExecutor(max_workers=4)
+
+
+def save_webhook_data(data: dict, filename: str):
+    """Save the full webhook payload under transcripts/"""
+    try:
+        # Create transcripts directory if it doesn't exist
+        os.makedirs('transcripts', exist_ok=True)
+        
+        # Save full data to file
+        with open(f'transcripts/{filename}', 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        
+        print(f"💾 Transcript saved to: transcripts/{filename}")
+        
+    except Exception as e:
+        print(f"⚠️  Failed to save transcript: {e}")
+    
+    # TODO: Add your custom processing here
+    # Examples:
+    # - Send to Slack
+    # - Store in database  
+    # - Process with AI for summary
+    # - Send email notification
+
 
 def verify_webhook_signature(payload: bytes, signature: str,
                              secret: str) -> bool:
@@ -70,15 +101,15 @@ def receive_transcript():
         print(f"Length: {len(payload)} bytes")
         print("Raw bytes (first 1000 chars):")
         print(payload[:1000])
-        print(f"{'='*80}")
-        print("Raw payload as string:")
-        try:
-            payload_str = payload.decode('utf-8')
-            print(payload_str)
-        except UnicodeDecodeError as e:
-            print(f"Could not decode as UTF-8: {e}")
-            print("Hex dump of first 200 bytes:")
-            print(payload[:200].hex())
+        if DEBUG_PAYLOADS:
+            print(f"{'='*80}")
+            print("Raw payload as string:")
+            try:
+                print(payload.decode('utf-8'))
+            except UnicodeDecodeError as e:
+                print(f"Could not decode as UTF-8: {e}")
+                print("Hex dump of first 200 bytes:")
+                print(payload[:200].hex())
         print(f"{'='*80}\n")
         
         signature = request.headers.get('X-Webhook-Signature', '')
@@ -134,7 +165,10 @@ def receive_transcript():
         print("TRANSCRIPT CONTENT:")
         print(f"{'='*60}")
         if transcript:
-            print(transcript)
+            if DEBUG_PAYLOADS or len(transcript) <= PREVIEW_CHARS:
+                print(transcript)
+            else:
+                print(f"{transcript[:PREVIEW_CHARS]}... ({len(transcript)} chars, set WEBHOOK_DEBUG=1 to print all)")
         else:
             print("⚠️  NO TRANSCRIPT CONTENT FOUND!")
             print(f"This appears to be a {webhook_source} status notification.")
@@ -142,35 +176,17 @@ def receive_transcript():
                 print("💡 Your Athena bot should fetch the transcript and send it separately.")
         print(f"{'='*60}\n")
         
-        # Save transcript to file
+        # Save transcript to file in the background
         filename = f"transcript_{meeting_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        
-        try:
-            # Create transcripts directory if it doesn't exist
-            os.makedirs('transcripts', exist_ok=True)
-            
-            # Save full data to file
-            with open(f'transcripts/{filename}', 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            print(f"💾 Transcript saved to: transcripts/{filename}")
-            
-        except Exception as e:
-            print(f"⚠️  Failed to save transcript: {e}")
-        
-        # TODO: Add your custom processing here
-        # Examples:
-        # - Send to Slack
-        # - Store in database  
-        # - Process with AI for summary
-        # - Send email notification
+        executor.submit(save_webhook_data, data, filename)
         
         return jsonify({
-            "status": "success",
-            "message": "Transcript received successfully",
+            "status": "accepted",
+            "message": "Transcript received, saving in the background",
             "meeting_id": meeting_id,
-            "processed_at": datetime.now().isoformat()
-        })
+            "output_file": f"transcripts/{filename}",
+            "received_at": datetime.now().isoformat()
+        }), 202
         
     except Exception as e:
         print(f"❌ Error processing webhook: {e}")
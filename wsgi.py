@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for the Athena Flask server
+
+Run with gunicorn (settings in gunicorn.conf.py):
+    gunicorn wsgi:application
+"""
+
+from flask_server import app
+
+application = app